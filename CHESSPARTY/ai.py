@@ -0,0 +1,248 @@
+"""
+Computer opponent for Chess Party.
+
+AIPlayer runs a negamax alpha-beta search over GameEngine.make_move and
+unmake_move, deepening one ply at a time until its time budget runs out
+and answering with the best move of the deepest finished search. Moves
+are tried best first: the transposition table's move, then captures of
+the most valuable piece by the least valuable one. Random events cannot
+be predicted, so the search only looks at the moves themselves.
+
+The game runs searches in a worker process, see ai_worker.py.
+"""
+
+import time
+from typing import Callable, NamedTuple, Optional
+from chess_piece import King
+from board import Move
+from engine import GameEngine
+from piece_store import KINDS, color_code, kind_code
+
+PIECE_VALUES = {"Pawn": 100, "Knight": 320, "Bishop": 330,
+                "Rook": 500, "Queen": 900, "King": 20000}
+CENTER_BONUS = 4  # Per step a non-King piece stands away from the edges
+MATE = 1000000  # Score of delivering mate, less one per ply it takes
+MATE_BOUND = MATE - 1000  # Scores past this are mates
+
+# Transposition table bounds
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget runs out
+    or the search is cancelled
+    """
+
+
+class TableEntry(NamedTuple):
+    """
+    Transposition table result for one position
+    """
+    depth: int
+    score: int  # Mates counted from this node, see to_table
+    bound: int  # EXACT, LOWER or UPPER
+    move: Optional[Move]
+
+
+class SearchResult(NamedTuple):
+    """
+    Best move found, from the deepest search that finished
+    """
+    move: Optional[Move]
+    score: int  # For the side to move, in centipawns
+    depth: int
+    nodes: int
+
+
+def to_table(score: int, ply: int) -> int:
+    """
+    Mate score counted from the node at ply rather than the root,
+    so a table entry holds wherever the position comes up again
+    """
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def from_table(score: int, ply: int) -> int:
+    """
+    Reverse of to_table for a node at ply
+    """
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
+
+
+def evaluate(engine: GameEngine) -> int:
+    """
+    Material and centralization, for the side to move.
+    Reads the store columns rather than the piece objects
+    """
+    store = engine.pieces
+    last_row, last_col = engine.rows - 1, engine.cols - 1
+    turn = color_code(engine.current_turn)
+    king = kind_code(King)
+    values = [PIECE_VALUES.get(cls.__name__, 0) for cls in KINDS]
+    score = 0
+    for kind, color, row, col in zip(store.kinds, store.colors,
+                                     store.rows, store.cols):
+        value = values[kind]
+        if kind != king:
+            value += CENTER_BONUS * (min(row, last_row - row)
+                                     + min(col, last_col - col))
+        score += value if color == turn else -value
+    return score
+
+
+class AIPlayer:
+    """
+    Alpha-beta player with iterative deepening, a transposition
+    table and a strict time budget per move
+    """
+
+    def __init__(self, time_budget: float = 1.0, max_depth: int = 32,
+                 table_size: int = 1 << 18,
+                 clock: Callable[[], float] = time.perf_counter,
+                 stop: Optional[Callable[[], bool]] = None) -> None:
+        """
+        Initialize the player
+
+        Args:
+            time_budget (float): seconds allowed per move
+            max_depth (int): deepest search, in plies
+            table_size (int): most transposition table entries kept
+            clock (Callable): time source, in seconds
+            stop (Callable): polled during a search, which gives up
+                as if out of time once it returns True
+        """
+        self.time_budget = time_budget
+        self.max_depth = max_depth
+        self.table_size = table_size
+        self.clock = clock
+        self.stop = stop
+        self.table: dict[tuple[int, str], TableEntry] = {}
+        self.nodes = 0
+        self._deadline = 0.0
+
+    def search(self, engine: GameEngine,
+               on_depth: Optional[Callable[[SearchResult], None]] = None
+               ) -> SearchResult:
+        """
+        Best move for the side to move in engine, within the time
+        budget. engine is left in the position it was given.
+        on_depth is called with the best move so far after each depth
+        """
+        self.nodes = 0
+        self._deadline = self.clock() + self.time_budget
+        if len(self.table) > self.table_size:
+            self.table.clear()
+
+        moves = engine.available_moves()
+        best = SearchResult(moves[0] if moves else None, 0, 0, 0)
+        if len(moves) < 2:
+            return best
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score = self._negamax(engine, depth, -MATE - 1, MATE + 1, 0)
+            except SearchTimeout:
+                break
+            entry = self.table[self._key(engine)]
+            best = SearchResult(entry.move, score, depth, self.nodes)
+            if on_depth is not None:
+                on_depth(best)
+            if abs(score) >= MATE - depth:  # Forced mate found
+                break
+        return best
+
+    def _key(self, engine: GameEngine) -> tuple[int, str]:
+        return (engine.board.zobrist_hash, engine.current_turn)
+
+    def _negamax(self, engine: GameEngine, depth: int,
+                 alpha: int, beta: int, ply: int) -> int:
+        """
+        Score of the position for the side to move, searched
+        depth plies deep within the window alpha, beta
+        """
+        self.nodes += 1
+        if not self.nodes & 255 and (
+                self.clock() > self._deadline
+                or (self.stop is not None and self.stop())):
+            raise SearchTimeout()
+
+        if engine.game_over:
+            if engine.winner is None:
+                return 0
+            won = engine.winner == engine.current_turn
+            return MATE - ply if won else ply - MATE
+        if depth == 0:
+            return evaluate(engine)
+
+        key = self._key(engine)
+        entry = self.table.get(key)
+        if entry is not None and entry.depth >= depth and ply > 0:
+            score = from_table(entry.score, ply)
+            if entry.bound == EXACT:
+                return score
+            if entry.bound == LOWER:
+                alpha = max(alpha, score)
+            else:
+                beta = min(beta, score)
+            if alpha >= beta:
+                return score
+
+        moves = engine.available_moves()
+        if not moves:  # Every piece frozen; nothing to search
+            return evaluate(engine)
+        self._order(engine, moves, entry.move if entry else None)
+
+        start_alpha = alpha
+        best_score = -MATE - 1
+        best_move = moves[0]
+        for move in moves:
+            engine.make_move(move)
+            try:
+                score = -self._negamax(engine, depth - 1,
+                                       -beta, -alpha, ply + 1)
+            finally:
+                engine.unmake_move()
+            if score > best_score:
+                best_score, best_move = score, move
+                alpha = max(alpha, score)
+                if alpha >= beta:
+                    break
+
+        if best_score <= start_alpha:
+            bound = UPPER
+        elif best_score >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table[key] = TableEntry(depth, to_table(best_score, ply),
+                                     bound, best_move)
+        return best_score
+
+    def _order(self, engine: GameEngine, moves: list[Move],
+               table_move: Optional[Move]) -> None:
+        """
+        Sort moves best first: the table's move, then captures
+        by most valuable victim and least valuable attacker
+        """
+        grid = engine.board.grid
+
+        def priority(move: Move) -> int:
+            if move == table_move:
+                return -MATE
+            (from_row, from_col), (to_row, to_col) = move
+            victim = grid[to_row][to_col]
+            if victim is None:
+                return 0
+            attacker = grid[from_row][from_col]
+            return (PIECE_VALUES.get(type(attacker).__name__, 0)
+                    - 10 * PIECE_VALUES.get(type(victim).__name__, 0))
+
+        moves.sort(key=priority)
@@ -0,0 +1,135 @@
+"""
+AI move search in a worker process.
+
+A search on a thread would still share the interpreter lock with the
+pygame loop, so AIWorker keeps one long-lived process with its own
+AIPlayer instead. A request ships it a compact Position, the
+worker streams back the best move of every finished depth, and the
+main loop polls for them once per frame without ever waiting.
+
+Requests are numbered. Cancelling one bumps a shared counter that the
+search polls, and any late results for it are dropped on arrival.
+"""
+
+import multiprocessing
+import queue
+from typing import Any, NamedTuple, Optional
+from ai import AIPlayer, SearchResult
+from engine import GameEngine
+
+
+class Update(NamedTuple):
+    """
+    One streamed result of request number request
+    """
+    request: int
+    result: SearchResult
+    done: bool  # True for the final answer
+
+
+def _serve(requests: Any, results: Any, cancelled: Any,
+           time_budget: float, max_depth: int) -> None:
+    """
+    Worker process loop: answer requests until given None.
+    One AIPlayer serves them all, so its table carries over
+    """
+    number = 0
+    ai = AIPlayer(time_budget, max_depth,
+                  stop=lambda: bool(cancelled.value >= number))
+
+    def stream(result: SearchResult) -> None:
+        results.put(Update(number, result, False))
+
+    while True:
+        request = requests.get()
+        if request is None:
+            return
+        number, position = request
+        engine = GameEngine.from_position(position)
+        results.put(Update(number, ai.search(engine, stream), True))
+
+
+class AIWorker:
+    """
+    Asynchronous move requests served by a worker process
+    """
+
+    def __init__(self, time_budget: float = 1.0,
+                 max_depth: int = 32) -> None:
+        """
+        Start the worker process. It is forked where the platform
+        allows; elsewhere it is spawned and imports the main script
+        afresh, so that script must only start the game under
+        if __name__ == "__main__" (after freeze_support in a frozen
+        executable)
+
+        Args:
+            time_budget (float): seconds allowed per move
+            max_depth (int): deepest search, in plies
+        """
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context(
+            "fork" if "fork" in methods else None)
+        self._requests: Any = context.Queue()
+        self._results: Any = context.Queue()
+        self._cancelled: Any = context.Value("q", 0)
+        self._process = context.Process(
+            target=_serve, daemon=True,
+            args=(self._requests, self._results, self._cancelled,
+                  time_budget, max_depth))
+        self._process.start()
+        self._number = 0
+        self.best: Optional[SearchResult] = None
+        self.done = False
+        self.pending = False
+
+    def request(self, engine: GameEngine) -> int:
+        """
+        Ask for a move in engine's current position, cancelling
+        any request still running. Returns the request number
+        """
+        self.cancel()
+        self._number += 1
+        self.best = None
+        self.done = False
+        self.pending = True
+        self._requests.put((self._number, engine.position()))
+        return self._number
+
+    def poll(self) -> Optional[SearchResult]:
+        """
+        Newest best move for the current request since the last
+        poll, None if nothing new arrived. done turns True with
+        the final answer
+        """
+        latest = None
+        while True:
+            try:
+                update: Update = self._results.get_nowait()
+            except queue.Empty:
+                return latest
+            if update.request != self._number or not self.pending:
+                continue  # Left over from a cancelled request
+            self.best = latest = update.result
+            if update.done:
+                self.done = True
+                self.pending = False
+
+    def cancel(self) -> None:
+        """
+        Stop the current request; its results are ignored
+        """
+        if self.pending:
+            with self._cancelled.get_lock():
+                self._cancelled.value = self._number
+            self.pending = False
+
+    def close(self) -> None:
+        """
+        Cancel any request and shut the worker process down
+        """
+        self.cancel()
+        self._requests.put(None)
+        self._process.join(timeout=1.0)
+        if self._process.is_alive():
+            self._process.terminate()
@@ -0,0 +1,78 @@
+import os
+import sys
+from typing import Optional, cast
+import pygame
+from pygame.rect import Rect
+from pygame.surface import Surface
+
+PIECE_DIR = "assets/pieces/"
+EFFECT_DIR = "assets/effects/"
+PIECE_NAMES = ["Pawn", "Rook", "Knight", "Bishop", "Queen", "King"]
+PIECE_COLORS = ["White", "Black"]
+
+
+def resource_path(relative_path: str) -> str:
+    """Path to resource for dev or PyInstaller"""
+    try:
+        base_path = cast(str, getattr(sys, "_MEIPASS", os.path.abspath(".")))
+    except Exception:
+        base_path = os.path.abspath(".")
+
+    return os.path.join(base_path, relative_path)
+
+
+class AssetManager:
+    """
+    Loads the 12 piece images once and bakes every requested
+    size into a single texture atlas, served by (name, color, size)
+    """
+
+    def __init__(self, sizes: tuple[int, ...]) -> None:
+        """
+        Load the piece images and build the atlas. Must run after
+        pygame.display.set_mode, since images are converted for it
+
+        Args:
+            sizes (tuple): square sizes to pre-scale, e.g. board
+                           squares and sidebar thumbnails
+        """
+        self.sizes = tuple(sorted(set(sizes), reverse=True))
+        keys = [(name, color) for name in PIECE_NAMES
+                for color in PIECE_COLORS]
+
+        # One atlas row per size, one column per piece image
+        largest = self.sizes[0]
+        self.atlas = pygame.Surface(
+            (largest * len(keys), sum(self.sizes)), pygame.SRCALPHA)
+        self._sprites: dict[tuple[str, str, int], Surface] = {}
+
+        for col, (name, color) in enumerate(keys):
+            path = f"{PIECE_DIR}{color.lower()}{name}.png"
+            image = pygame.image.load(resource_path(path)).convert_alpha()
+            # Smaller sizes are scaled from the largest, as before
+            base = pygame.transform.scale(image, (largest, largest))
+            y = 0
+            for size in self.sizes:
+                scaled = base
+                if size != largest:
+                    scaled = pygame.transform.scale(base, (size, size))
+                rect = Rect(col * largest, y, size, size)
+                # Adding onto the empty atlas copies RGBA exactly
+                self.atlas.blit(scaled, rect,
+                                special_flags=pygame.BLEND_RGBA_ADD)
+                sprite = self.atlas.subsurface(rect)
+                self._sprites[(name, color, size)] = sprite
+                y += size
+
+    def get(self, name: str, color: str, size: int) -> Optional[Surface]:
+        """
+        Sprite for a piece at a pre-baked size, or None if unknown
+        """
+        return self._sprites.get((name, color, size))
+
+    def load_effect(self, filename: str, size: int) -> Surface:
+        """
+        Load an effect overlay from assets/effects/ scaled to size
+        """
+        image = pygame.image.load(resource_path(f"{EFFECT_DIR}{filename}"))
+        return pygame.transform.scale(image, (size, size))
@@ -0,0 +1,102 @@
+"""
+Attacked squares of every piece on a Board, kept up to date move by move.
+
+For each piece the map holds the squares it attacks, and for each square
+the pieces attacking it, counted per color. Filling or emptying a square
+only changes the attacks of the pieces that attacked it (a slider's ray
+now stops there, or now runs through), so those are recomputed instead
+of the whole board.
+"""
+
+from __future__ import annotations
+from math import gcd
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from board import Board
+    from chess_piece import ChessPiece
+
+Square = tuple[int, int]
+
+
+class AttackMap:
+    """
+    Per-piece and per-color attack maps of one board
+    """
+
+    def __init__(self, board: Board) -> None:
+        """
+        Initialize empty maps for board
+        """
+        self.board = board
+        self.targets: dict[ChessPiece, list[Square]] = {}
+        # Insertion-ordered dicts used as sets, like Board.by_color
+        self.attackers: dict[Square, dict[ChessPiece, None]] = {}
+        self.counts: dict[str, dict[Square, int]] = {}
+
+    def clear(self) -> None:
+        """
+        Forget every attack
+        """
+        self.targets.clear()
+        self.attackers.clear()
+        self.counts.clear()
+
+    def add(self, piece: ChessPiece) -> None:
+        """
+        Record the attacks of piece from its current square
+        """
+        targets = piece.get_attacks(self.board)
+        self.targets[piece] = targets
+        counts = self.counts.setdefault(piece._color, {})
+        for square in targets:
+            self.attackers.setdefault(square, {})[piece] = None
+            counts[square] = counts.get(square, 0) + 1
+
+    def discard(self, piece: ChessPiece) -> None:
+        """
+        Drop the attacks of piece, if it has any recorded
+        """
+        targets = self.targets.pop(piece, None)
+        if targets is None:
+            return
+        counts = self.counts[piece._color]
+        for square in targets:
+            del self.attackers[square][piece]
+            if counts[square] == 1:
+                del counts[square]
+            else:
+                counts[square] -= 1
+
+    def refresh(self, square: Square) -> None:
+        """
+        Recompute the pieces attacking square after it was filled
+        or emptied. Only a piece whose line carries on past square
+        can see a difference, so jumps and single steps are skipped
+        """
+        row, col = square
+        for piece in list(self.attackers.get(square, ())):
+            dr, dc = row - piece._row, col - piece._col
+            distance = gcd(dr, dc)
+            step = (dr // distance, dc // distance)
+            if piece.get_attack_range(step) > distance:
+                self.discard(piece)
+                self.add(piece)
+
+    def is_attacked(self, square: Square, color: str) -> bool:
+        """
+        True if any piece of color attacks square
+        """
+        return square in self.counts.get(color, ())
+
+    def attacked(self, color: str) -> set[Square]:
+        """
+        Every square attacked by color
+        """
+        return set(self.counts.get(color, ()))
+
+    def attackers_of(self, square: Square) -> list[ChessPiece]:
+        """
+        Pieces of either color attacking square
+        """
+        return list(self.attackers.get(square, ()))
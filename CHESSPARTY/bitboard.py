@@ -0,0 +1,208 @@
+from __future__ import annotations
+from board import Board
+from move_tables import SIZE, Square, KNIGHT_TARGETS, KING_TARGETS, RAYS
+
+from typing import TYPE_CHECKING, Iterable, Optional
+if TYPE_CHECKING:
+    from chess_piece import ChessPiece
+
+# Square index is row * 8 + col, so bit 0 is (0, 0) and bit 63 is (7, 7)
+SQUARES: list[Square] = [divmod(sq, SIZE) for sq in range(64)]
+
+
+def _mask_of(squares: tuple[Square, ...]) -> int:
+    """
+    Build a mask with a bit set for every square
+    """
+    mask = 0
+    for r, c in squares:
+        mask |= 1 << (r * SIZE + c)
+    return mask
+
+
+def _pawn_mask(row: int, col: int, direction: int) -> int:
+    """
+    Build a mask of the two squares a pawn captures on
+    """
+    return _mask_of(tuple((row + direction, c) for c in (col - 1, col + 1)
+                          if 0 <= row + direction < SIZE and 0 <= c < SIZE))
+
+
+# Precomputed attack masks, indexed by square
+KNIGHT_ATTACKS: list[int] = [_mask_of(KNIGHT_TARGETS[r][c])
+                             for r, c in SQUARES]
+KING_ATTACKS: list[int] = [_mask_of(KING_TARGETS[r][c]) for r, c in SQUARES]
+PAWN_ATTACKS: dict[str, list[int]] = {
+    "White": [_pawn_mask(r, c, 1) for r, c in SQUARES],
+    "Black": [_pawn_mask(r, c, -1) for r, c in SQUARES],
+}
+RAY_MASKS: dict[tuple[int, int], list[int]] = {
+    direction: [_mask_of(RAYS[r][c][direction]) for r, c in SQUARES]
+    for direction in RAYS[0][0]
+}
+
+
+def mask_to_moves(mask: int) -> list[tuple[int, int]]:
+    """
+    Convert a bitboard into a list of (row, col) tuples
+    """
+    moves = []
+    while mask:
+        low = mask & -mask
+        moves.append(SQUARES[low.bit_length() - 1])
+        mask ^= low
+    return moves
+
+
+class BitBoard(Board):
+    """
+    Board engine that mirrors the grid with 64-bit occupancy
+    bitboards per color and per (piece type, color)
+    """
+
+    def __init__(self, pieces: Iterable[ChessPiece],
+                 rows: int = 8, cols: int = 8) -> None:
+        """
+        Initialize bitboards, then the regular grid
+        """
+        if rows != SIZE or cols != SIZE:
+            raise ValueError("BitBoard only supports an 8x8 board")
+        self.occupied = 0
+        self.occupancy: dict[str, int] = {}
+        self.piece_boards: dict[tuple[str, str], int] = {}
+        super().__init__(pieces, rows, cols)
+
+    def _toggle(self, piece: ChessPiece, sq: int) -> None:
+        """
+        Flip the bit for piece on square sq in every bitboard
+        """
+        bit = 1 << sq
+        color = piece._color
+        key = (type(piece).__name__, color)
+        self.occupied ^= bit
+        self.occupancy[color] = self.occupancy.get(color, 0) ^ bit
+        self.piece_boards[key] = self.piece_boards.get(key, 0) ^ bit
+
+    def update(self, pieces: Iterable[ChessPiece]) -> None:
+        """
+        Rebuild the grid and all bitboards from scratch
+        """
+        super().update(pieces)
+        self.occupied = 0
+        self.occupancy = {}
+        self.piece_boards = {}
+        for piece in pieces:
+            self._toggle(piece, piece._row * SIZE + piece._col)
+
+    def place_piece(self, piece: ChessPiece) -> Optional[ChessPiece]:
+        """
+        Put piece on its square, clearing the bits of any
+        piece it replaces
+        """
+        previous = super().place_piece(piece)
+        sq = piece._row * SIZE + piece._col
+        if previous is not None:
+            self._toggle(previous, sq)
+        self._toggle(piece, sq)
+        return previous
+
+    def remove_piece(self, piece: ChessPiece) -> None:
+        """
+        Clear piece from the grid and the bitboards
+        """
+        if self.grid[piece._row][piece._col] is piece:
+            self._toggle(piece, piece._row * SIZE + piece._col)
+        super().remove_piece(piece)
+
+    def is_empty(self, row: int, col: int) -> bool:
+        """
+        Occupancy test straight from the bitboard
+        """
+        if 0 <= row < SIZE and 0 <= col < SIZE:
+            return not (self.occupied >> (row * SIZE + col)) & 1
+        return True
+
+    def get_pieces_mask(self, name: str, color: str) -> int:
+        """
+        Bitboard of every piece of class name and color
+        """
+        return self.piece_boards.get((name, color), 0)
+
+    def own_mask(self, color: str) -> int:
+        """
+        Bitboard of every piece of the given color
+        """
+        return self.occupancy.get(color, 0)
+
+    def enemy_mask(self, color: str) -> int:
+        """
+        Bitboard of every piece not of the given color
+        """
+        return self.occupied & ~self.occupancy.get(color, 0)
+
+    def slider_attacks(self, sq: int,
+                       directions: list[tuple[int, int]]) -> int:
+        """
+        Squares reached by sliding from sq in each direction,
+        stopping on (and including) the first occupied square
+        """
+        occupied = self.occupied
+        attacks = 0
+        for direction in directions:
+            rays = RAY_MASKS[direction]
+            ray = rays[sq]
+            blockers = ray & occupied
+            if blockers:
+                dr, dc = direction
+                if dr > 0 or (dr == 0 and dc > 0):
+                    blocker = (blockers & -blockers).bit_length() - 1
+                else:
+                    blocker = blockers.bit_length() - 1
+                ray ^= rays[blocker]
+            attacks |= ray
+        return attacks
+
+    def stepper_attacks(self, sq: int, directions: list[tuple[int, int]],
+                        max_steps: int) -> int:
+        """
+        Generic walk for directions or step limits that have
+        no precomputed ray mask
+        """
+        occupied = self.occupied
+        row, col = SQUARES[sq]
+        attacks = 0
+        for dr, dc in directions:
+            for step in range(1, max_steps + 1):
+                r, c = row + dr * step, col + dc * step
+                if not (0 <= r < SIZE and 0 <= c < SIZE):
+                    break
+                bit = 1 << (r * SIZE + c)
+                attacks |= bit
+                if occupied & bit:
+                    break
+        return attacks
+
+    def pawn_moves(self, sq: int, color: str) -> int:
+        """
+        Pawn pushes (single, and double from the start row)
+        plus diagonal captures
+        """
+        row, col = SQUARES[sq]
+        white = color == "White"
+        direction = 1 if white else -1
+        start_row = 1 if white else 6
+        moves = 0
+
+        one_step_row = row + direction
+        if not 0 <= one_step_row < SIZE:
+            return 0
+        one_step = 1 << (one_step_row * SIZE + col)
+        if not self.occupied & one_step:
+            moves |= one_step
+            if row == start_row:
+                two_step = 1 << ((row + 2 * direction) * SIZE + col)
+                if not self.occupied & two_step:
+                    moves |= two_step
+
+        diagonals = PAWN_ATTACKS["White" if white else "Black"][sq]
+        return moves | (diagonals & self.enemy_mask(color))
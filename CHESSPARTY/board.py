@@ -1,10 +1,20 @@
 from __future__ import annotations
+from attack_map import AttackMap
 from board_piece import BoardPiece
+from move_cache import MoveCache
+from move_tables import QUEEN_DIRECTIONS
+from undo import UndoStep
+from zobrist import piece_key, frozen_key
 
-from typing import TYPE_CHECKING, Optional
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Optional
 if TYPE_CHECKING:
     from chess_piece import ChessPiece
 
+Square = tuple[int, int]
+Move = tuple[Square, Square]  # ((from_row, from_col), (to_row, to_col))
+LegalFilter = Callable[["ChessPiece", list[Square]], list[Square]]
+
 
 class Board:
     """
@@ -12,20 +22,34 @@ class Board:
     cohesive board for Chess Party
     """
 
-    def __init__(self, pieces: list[ChessPiece],
-                 rows: int = 8, cols: int = 8) -> None:
+    def __init__(self, pieces: Iterable[ChessPiece],
+                 rows: int = 8, cols: int = 8,
+                 cache_size: int = 4096) -> None:
         """
         Initalize Chess board
             - Rows
             - Columns
-            - Grid
+            - Grid (square to piece index)
+            - Pieces by color
             - Board state
+            - Position hash and move cache
+            - Attack maps
         """
         self.rows = rows
         self.cols = cols
+        self.zobrist_hash = 0
+        self.move_cache = MoveCache(cache_size)
+        self.attacks = AttackMap(self)
+        # Undo steps for every change are appended here while set
+        self.journal: Optional[list[UndoStep]] = None
+        # Last _legal_filter built, with the hash and color it is for
+        self._legal: Optional[tuple[int, str, LegalFilter]] = None
         self.grid: list[list[Optional[ChessPiece]]] = [
             [None for _ in range(self.cols)]
             for _ in range(self.rows)]
+        # Insertion-ordered dicts used as sets, so iterating
+        # them is repeatable for seeded games
+        self.by_color: dict[str, dict[ChessPiece, None]] = {}
         self.board_state: list[list[BoardPiece]] = [
             [
                 BoardPiece(
@@ -40,19 +64,375 @@ class Board:
         ]
         self.update(pieces)
 
-    def update(self, pieces: list[ChessPiece]) -> None:
+    def update(self, pieces: Iterable[ChessPiece]) -> None:
         """
+        Rebuild the grid and board state from scratch.
+        Prefer place_piece, remove_piece and move_piece
+        for single changes on a long-lived board.
+        Not journaled, so it cannot be undone
         """
         self.grid = [[None for _ in range(self.cols)]
                      for _ in range(self.rows)]
         for row in range(self.rows):
             for col in range(self.cols):
                 self.board_state[row][col].set_piece_in_place(False)
+        self.by_color = {}
+        self.zobrist_hash = 0
+        self.move_cache.clear()
 
         for piece in pieces:
             row, col = piece._row, piece._col
+            previous = self.grid[row][col]
+            if previous is not None:
+                self.zobrist_hash ^= self._key(previous)
+                self._unindex(previous)
             self.grid[row][col] = piece
+            self.by_color.setdefault(piece._color, {})[piece] = None
             self.board_state[row][col].set_piece_in_place(True)
+            self.zobrist_hash ^= self._key(piece)
+
+        # Once every piece is down, so rays stop at the right blockers
+        self.attacks.clear()
+        for pieces_of_color in self.by_color.values():
+            for piece in pieces_of_color:
+                self.attacks.add(piece)
+
+    def _key(self, piece: ChessPiece) -> int:
+        """
+        Zobrist key of piece on its current square,
+        including its freeze counter
+        """
+        key = piece_key(type(piece).__name__, piece._color,
+                        piece._row, piece._col)
+        if piece._frozen_turns > 0:
+            key ^= frozen_key(piece._row, piece._col, piece._frozen_turns)
+        return key
+
+    def compute_hash(self) -> int:
+        """
+        Recompute the position hash from the whole grid.
+        Only meant for checking the incremental zobrist_hash
+        """
+        value = 0
+        for row in self.grid:
+            for piece in row:
+                if piece is not None:
+                    value ^= self._key(piece)
+        return value
+
+    def place_piece(self, piece: ChessPiece) -> Optional[ChessPiece]:
+        """
+        Put piece on its own square, returning whatever
+        piece previously occupied that square
+        """
+        row, col = piece._row, piece._col
+        previous = self.grid[row][col]
+        if previous is not None:
+            self.zobrist_hash ^= self._key(previous)
+            self._unindex(previous)
+            self.attacks.discard(previous)
+        self.grid[row][col] = piece
+        self.by_color.setdefault(piece._color, {})[piece] = None
+        self.board_state[row][col].set_piece_in_place(True)
+        self.zobrist_hash ^= self._key(piece)
+        self.attacks.add(piece)
+        if previous is None:  # Newly filled, so it now blocks rays
+            self.attacks.refresh((row, col))
+        if self.journal is not None:
+            self.journal.append((self._unplace, (piece, previous)))
+        return previous
+
+    def _unplace(self, piece: ChessPiece,
+                 previous: Optional[ChessPiece]) -> None:
+        """
+        Undo place_piece: take piece off, putting back previous
+        """
+        if previous is None:
+            self.remove_piece(piece)
+        else:
+            self.place_piece(previous)
+
+    def remove_piece(self, piece: ChessPiece) -> None:
+        """
+        Clear the square held by piece, if piece is still on it
+        """
+        row, col = piece._row, piece._col
+        if self.grid[row][col] is piece:
+            self.zobrist_hash ^= self._key(piece)
+            self._unindex(piece)
+            self.grid[row][col] = None
+            self.board_state[row][col].set_piece_in_place(False)
+            self.attacks.discard(piece)
+            self.attacks.refresh((row, col))
+            if self.journal is not None:
+                self.journal.append((self.place_piece, (piece,)))
+
+    def _unindex(self, piece: ChessPiece) -> None:
+        """
+        Drop piece from the pieces by color
+        """
+        pieces = self.by_color.get(piece._color, {})
+        if self.journal is not None and piece in pieces:
+            # Putting piece back adds it last; this restores its place
+            index = next(index for index, other in enumerate(pieces)
+                         if other is piece)
+            self.journal.append((self._reorder, (piece._color, index)))
+        pieces.pop(piece, None)
+
+    def _reorder(self, color: str, index: int) -> None:
+        """
+        Undo step moving the last piece of color back to index,
+        by putting the pieces after it back at the end
+        """
+        pieces = self.by_color[color]
+        for piece in list(islice(pieces, index, len(pieces) - 1)):
+            del pieces[piece]
+            pieces[piece] = None
+
+    def pieces_of(self, color: str) -> list[ChessPiece]:
+        """
+        Pieces of color on the board, without scanning the grid
+        """
+        return list(self.by_color.get(color, ()))
+
+    def move_piece(self, piece: ChessPiece,
+                   row: int, col: int) -> Optional[ChessPiece]:
+        """
+        Move piece to (row, col) and update the piece's position.
+        Returns the captured piece, if the target was occupied
+        """
+        self.remove_piece(piece)
+        if self.journal is not None:
+            self.journal.append((self._set_square,
+                                 (piece, piece._row, piece._col)))
+        self._set_square(piece, row, col)
+        return self.place_piece(piece)
+
+    def _set_square(self, piece: ChessPiece, row: int, col: int) -> None:
+        """
+        Point piece at (row, col) without touching the grid
+        """
+        piece.move_to(row, col)
+
+    def freeze_piece(self, piece: ChessPiece, turns: int) -> None:
+        """
+        Freeze piece for turns more turns, keeping the hash in sync
+        """
+        if self.journal is not None:
+            self.journal.append((self._set_frozen,
+                                 (piece, piece._frozen_turns)))
+        on_board = self.grid[piece._row][piece._col] is piece
+        if on_board:
+            self.zobrist_hash ^= self._key(piece)
+        piece.freeze(turns)
+        if on_board:
+            self.zobrist_hash ^= self._key(piece)
+
+    def reduce_frozen(self, piece: ChessPiece) -> None:
+        """
+        Count down one frozen turn of piece, keeping the hash in sync
+        """
+        if self.journal is not None:
+            self.journal.append((self._set_frozen,
+                                 (piece, piece._frozen_turns)))
+        on_board = self.grid[piece._row][piece._col] is piece
+        if on_board:
+            self.zobrist_hash ^= self._key(piece)
+        piece.reduce_frozen()
+        if on_board:
+            self.zobrist_hash ^= self._key(piece)
+
+    def _set_frozen(self, piece: ChessPiece, turns: int) -> None:
+        """
+        Undo freeze_piece and reduce_frozen, keeping the hash in sync
+        """
+        on_board = self.grid[piece._row][piece._col] is piece
+        if on_board:
+            self.zobrist_hash ^= self._key(piece)
+        piece._frozen_turns = turns
+        if on_board:
+            self.zobrist_hash ^= self._key(piece)
+
+    def get_valid_moves(self, piece: ChessPiece) -> list[tuple[int, int]]:
+        """
+        Moves for piece, memoized by position hash and square.
+        Any change to the position changes the hash, so stale
+        entries are never hit and simply age out of the cache
+        """
+        row, col = piece._row, piece._col
+        if self.grid[row][col] is not piece:
+            return piece.get_valid_moves(self)
+
+        key = (self.zobrist_hash, row, col)
+        moves = self.move_cache.get(key)
+        if moves is None:
+            moves = piece.get_valid_moves(self)
+            self.move_cache.put(key, moves)
+        return moves
+
+    def king_of(self, color: str) -> Optional[ChessPiece]:
+        """
+        The King of color, None once it is gone
+        """
+        for piece in self.by_color.get(color, ()):
+            if type(piece).__name__ == "King":
+                return piece
+        return None
+
+    def _enemy_attackers(self, square: Square,
+                         color: str) -> list[ChessPiece]:
+        """
+        Pieces not of color attacking square
+        """
+        return [piece for piece in self.attacks.attackers.get(square, ())
+                if piece._color != color]
+
+    def in_check(self, color: str) -> bool:
+        """
+        True if the King of color is attacked
+        """
+        king = self.king_of(color)
+        if king is None:
+            return False
+        return bool(self._enemy_attackers((king._row, king._col), color))
+
+    def _pins(self, king: ChessPiece) -> dict[ChessPiece, set[Square]]:
+        """
+        Pieces pinned to king, each with the squares it may still
+        reach: the line between king and the pinning piece,
+        capturing it included
+        """
+        pins: dict[ChessPiece, set[Square]] = {}
+        color = king._color
+        for dr, dc in QUEEN_DIRECTIONS:
+            row, col = king._row + dr, king._col + dc
+            shield: Optional[ChessPiece] = None
+            line: set[Square] = set()
+            distance = 1
+            while 0 <= row < self.rows and 0 <= col < self.cols:
+                line.add((row, col))
+                piece = self.grid[row][col]
+                if piece is not None:
+                    if piece._color == color:
+                        if shield is not None:
+                            break
+                        shield = piece
+                    else:
+                        if (shield is not None and piece.get_attack_range(
+                                (-dr, -dc)) >= distance):
+                            pins[shield] = line
+                        break
+                row, col = row + dr, col + dc
+                distance += 1
+        return pins
+
+    def _legal_filter(self, color: str) -> LegalFilter:
+        """
+        Function narrowing the valid targets of a piece of color to
+        those that do not leave its King attacked. Works out checks,
+        pins and the squares around the King once, from the attack
+        maps, instead of playing out every move. The last one is
+        kept until the position hash changes
+        """
+        if self._legal is not None:
+            key, cached_color, cached = self._legal
+            if key == self.zobrist_hash and cached_color == color:
+                return cached
+        legal = self._build_legal_filter(color)
+        self._legal = (self.zobrist_hash, color, legal)
+        return legal
+
+    def _build_legal_filter(self, color: str) -> LegalFilter:
+        """
+        Uncached _legal_filter
+        """
+        king = self.king_of(color)
+        if king is None:
+            return lambda piece, targets: targets
+
+        square = (king._row, king._col)
+        checkers = self._enemy_attackers(square, color)
+        pins = self._pins(king)
+        enemies = [counts for other, counts in self.attacks.counts.items()
+                   if other != color]
+        # Squares answering a single check: taking the checker,
+        # or stepping between it and the King
+        blocks: Optional[set[Square]] = None
+        # Squares behind the King on a checking ray, still attacked
+        # once the King steps back along it
+        behind: set[Square] = set()
+        for checker in checkers:
+            dr, dc = king._row - checker._row, king._col - checker._col
+            distance = max(abs(dr), abs(dc))
+            step = ((dr > 0) - (dr < 0), (dc > 0) - (dc < 0))
+            on_line = dr == 0 or dc == 0 or abs(dr) == abs(dc)
+            reach = checker.get_attack_range(step) if on_line else 0
+            blocks = {(checker._row, checker._col)}
+            if reach >= distance:
+                blocks.update((checker._row + step[0] * i,
+                               checker._col + step[1] * i)
+                              for i in range(1, distance))
+                if reach > distance:
+                    behind.add((king._row + step[0], king._col + step[1]))
+        if len(checkers) > 1:
+            blocks = set()  # Only the King itself can answer
+
+        def legal(piece: ChessPiece, targets: list[Square]) -> list[Square]:
+            if piece is king:
+                return [target for target in targets
+                        if target not in behind
+                        and not any(target in counts for counts in enemies)]
+            pin = pins.get(piece)
+            if blocks is None and pin is None:
+                return targets
+            return [target for target in targets
+                    if (blocks is None or target in blocks)
+                    and (pin is None or target in pin)]
+
+        return legal
+
+    def legal_targets(self, piece: ChessPiece) -> list[Square]:
+        """
+        Valid targets of piece that do not leave its King attacked
+        """
+        return self._legal_filter(piece._color)(
+            piece, self.get_valid_moves(piece))
+
+    def legal_moves(self, color: str) -> list[Move]:
+        """
+        Every legal move of the pieces of color that are not frozen.
+        Without a King on the board every valid move is legal
+        """
+        legal = self._legal_filter(color)
+        moves = []
+        for piece in self.by_color.get(color, ()):
+            if piece._frozen_turns:
+                continue
+            start = (piece._row, piece._col)
+            for target in legal(piece, self.get_valid_moves(piece)):
+                moves.append((start, target))
+        return moves
+
+    def has_legal_move(self, color: str) -> bool:
+        """
+        True if any piece of color, frozen or not, has a legal move.
+        Freezes wear off, so they do not count towards a mate
+        """
+        legal = self._legal_filter(color)
+        return any(legal(piece, self.get_valid_moves(piece))
+                   for piece in self.by_color.get(color, ()))
+
+    def is_checkmate(self, color: str) -> bool:
+        """
+        True if color is in check and has no legal move
+        """
+        return self.in_check(color) and not self.has_legal_move(color)
+
+    def is_stalemate(self, color: str) -> bool:
+        """
+        True if color is not in check but has no legal move
+        """
+        return not self.in_check(color) and not self.has_legal_move(color)
 
     def get_piece(self, row: int, col: int) -> Optional[ChessPiece]:
         """
@@ -1,5 +1,7 @@
 # BoardPiece class
 class BoardPiece:
+    __slots__ = ("_label", "_color", "_surprise", "_piece_in_place")
+
     def __init__(self, label: str, color: str,
                  surprise: object, piece_in_place: bool):
         self._label = label
@@ -1,5 +1,13 @@
 from abc import ABC
+from typing import Optional, Union
 from board import Board
+from bitboard import BitBoard, KING_ATTACKS, KNIGHT_ATTACKS, RAY_MASKS
+from bitboard import mask_to_moves
+from move_tables import RAYS, KNIGHT_TARGETS, KING_TARGETS, SIZE
+from move_tables import build_jumps, build_ray
+from piece_store import PieceRow, PieceStore, color_code, kind_code
+
+NO_TIMER = 0  # Effect timer value while no overlay is fading
 
 
 # ChessPiece class
@@ -9,10 +17,20 @@ class ChessPiece(ABC):
     Each unique piece will inherit from this class
     """
     unit_count: int = 0
+    # Everything that changes during a game lives in the PieceStore
+    # arrays; a piece holds its store and its index there, plus the
+    # fields that never change. _color, _row and _col are also kept
+    # here, since the move generators read them far more often than
+    # anything else; move_to writes the square to both places
+    __slots__ = ("_name", "_color", "_row", "_col", "_unit_count_limit",
+                 "_movement_count", "_movement_style", "_store", "_index")
+    _store: Union[PieceStore, PieceRow]
+    _index: int
 
     def __init__(self, name: str, color: str, row: int, col: int,
                  unit_count_limit: int, movement_count: int,
-                 movement_style: str):
+                 movement_style: str,
+                 store: Optional[PieceStore] = None):
         self._name = name
         self._color = color
         self._row = row
@@ -20,18 +38,85 @@ class ChessPiece(ABC):
         self._unit_count_limit = unit_count_limit
         self._movement_count = movement_count
         self._movement_style = movement_style
-        self._frozen_turns = 0  # For event tracking
         self.__class__.unit_count += 1
-        self.promoted = False
-        self.frozen = False
-        self.promotion_timer: int | None = None
-        self.frozen_timer: int | None = None
+        # Frozen turns for event tracking, then promoted, frozen and
+        # both effect timers
+        values = (kind_code(type(self)), color_code(color),
+                  row, col, 0, False, False, NO_TIMER, NO_TIMER)
+        if store is None:
+            PieceRow(self, values)
+        else:
+            store._push(self, values)
+
+    def copy_fields(self, other: "ChessPiece") -> None:
+        """
+        Copy the fields kept outside the store from other
+        """
+        self._name = other._name
+        self._color = other._color
+        self._row = other._row
+        self._col = other._col
+        self._unit_count_limit = other._unit_count_limit
+        self._movement_count = other._movement_count
+        self._movement_style = other._movement_style
+
+    def move_to(self, row: int, col: int) -> None:
+        """
+        Point this piece at (row, col), keeping its store in sync
+        """
+        self._row = row
+        self._col = col
+        self._store.rows[self._index] = row
+        self._store.cols[self._index] = col
+
+    # Views onto this piece's entry in its PieceStore
+    @property
+    def _frozen_turns(self) -> int:
+        return self._store.frozen_turns[self._index]
+
+    @_frozen_turns.setter
+    def _frozen_turns(self, turns: int) -> None:
+        self._store.frozen_turns[self._index] = turns
+
+    @property
+    def promoted(self) -> bool:
+        return bool(self._store.promoted[self._index])
+
+    @promoted.setter
+    def promoted(self, promoted: bool) -> None:
+        self._store.promoted[self._index] = promoted
+
+    @property
+    def frozen(self) -> bool: return bool(self._store.frozen[self._index])
+
+    @frozen.setter
+    def frozen(self, frozen: bool) -> None:
+        self._store.frozen[self._index] = frozen
+
+    @property
+    def promotion_timer(self) -> int:
+        return self._store.promotion_timers[self._index]
+
+    @promotion_timer.setter
+    def promotion_timer(self, timer: int) -> None:
+        self._store.promotion_timers[self._index] = timer
+
+    @property
+    def frozen_timer(self) -> int:
+        return self._store.frozen_timers[self._index]
+
+    @frozen_timer.setter
+    def frozen_timer(self, timer: int) -> None:
+        self._store.frozen_timers[self._index] = timer
 
     def get_name(self) -> str: return self._name
     def set_name(self, name: str) -> None: self._name = name
 
     def get_color(self) -> str: return self._color
-    def set_color(self, color: str) -> None: self._color = color
+
+    def set_color(self, color: str) -> None:
+        self._color = color
+        self._store.colors[self._index] = color_code(color)
 
     def get_move_directions(self) -> list[tuple[int, int]]:
         """
@@ -57,27 +142,90 @@ class ChessPiece(ABC):
         Return list of (row, col) tuples that represent
         the legal movements of each piece
         """
+        if isinstance(board, BitBoard):
+            return mask_to_moves(self.get_move_mask(board))
+
         moves = []
-        directions = self.get_move_directions()
+        grid = board.grid
         max_steps = self.get_max_steps()
-
-        for dr, dc in directions:
-            for step in range(1, max_steps + 1):
-                new_row = self._row + dr * step
-                new_col = self._col + dc * step
-                if not (0 <= new_row < 8 and 0 <= new_col < 8):
-                    break
-
-                target = board.get_piece(new_row, new_col)
+        row, col = self._row, self._col
+        rays = RAYS[row][col] if row < SIZE and col < SIZE else {}
+
+        for direction in self.get_move_directions():
+            ray = rays.get(direction)
+            if ray is None:  # Not a straight line, walk it the slow way
+                ray = build_ray(row, col, *direction)
+            if max_steps < len(ray):
+                ray = ray[:max_steps]
+
+            for square in ray:
+                target = grid[square[0]][square[1]]
                 if target is None:
-                    moves.append((new_row, new_col))
+                    moves.append(square)
                 else:
-                    if target.get_color() != self._color:
-                        moves.append((new_row, new_col))  # Capture
+                    if target._color != self._color:
+                        moves.append(square)  # Capture
                     break  # Can't jump over pieces
 
         return moves
 
+    def get_attacks(self, board: Board) -> list[tuple[int, int]]:
+        """
+        Squares this piece attacks. Like get_valid_moves, except
+        the piece ending a ray counts whatever its color, since a
+        piece also guards its own side
+        """
+        attacks = []
+        grid = board.grid
+        max_steps = self.get_max_steps()
+        row, col = self._row, self._col
+        rays = RAYS[row][col] if row < SIZE and col < SIZE else {}
+
+        for direction in self.get_move_directions():
+            ray = rays.get(direction)
+            if ray is None:
+                ray = build_ray(row, col, *direction)
+            for square in ray[:max_steps]:
+                attacks.append(square)
+                if grid[square[0]][square[1]] is not None:
+                    break
+
+        return attacks
+
+    def get_attack_range(self, direction: tuple[int, int]) -> int:
+        """
+        How many times this piece repeats the step direction while
+        attacking over empty squares, 0 if it never steps that way
+        """
+        if direction in self.get_move_directions():
+            return self.get_max_steps()
+        return 0
+
+    def _targets(self, table: list[list[tuple[tuple[int, int], ...]]]
+                 ) -> tuple[tuple[int, int], ...]:
+        """
+        Squares one jump away, from table while on the 8x8 board it
+        covers, or walked the slow way off it
+        """
+        row, col = self._row, self._col
+        if row < SIZE and col < SIZE:
+            return table[row][col]
+        return build_jumps(row, col, self.get_move_directions())
+
+    def get_move_mask(self, board: BitBoard) -> int:
+        """
+        Bitboard version of get_valid_moves; sliders with
+        precomputed rays use them, anything else walks step by step
+        """
+        sq = self._row * 8 + self._col
+        directions = self.get_move_directions()
+        max_steps = self.get_max_steps()
+        if max_steps >= 7 and all(d in RAY_MASKS for d in directions):
+            attacks = board.slider_attacks(sq, directions)
+        else:
+            attacks = board.stepper_attacks(sq, directions, max_steps)
+        return attacks & ~board.own_mask(self._color)
+
     def freeze(self, turns: int) -> None:
         self._frozen_turns += turns
 
@@ -98,12 +246,14 @@ class Pawn(ChessPiece):
     Class for Pawn pieces
     """
     unit_count = 0
+    __slots__ = ()
 
     def __init__(self, name: str, color: str, row: int, col: int,
                  unit_count_limit: int, movement_count: int,
-                 movement_style: str):
+                 movement_style: str,
+                 store: Optional[PieceStore] = None):
         super().__init__(name, color, row, col, unit_count_limit,
-                         movement_count, movement_style)
+                         movement_count, movement_style, store)
 
     def get_valid_moves(self, board: Board) -> list[tuple[int, int]]:
         """
@@ -112,25 +262,29 @@ class Pawn(ChessPiece):
             - Move forward two spaces if at beginning/never moved yet
         - Capture diagonally
         """
+        if isinstance(board, BitBoard):
+            return mask_to_moves(self.get_move_mask(board))
+
         direction = 1 if self._color == "White" else -1
+        row, col = self._row, self._col
         moves = []
 
         # Move forward once
-        one_step_row = self._row + direction
-        if 0 <= one_step_row < 8 and board.is_empty(one_step_row, self._col):
-            moves.append((one_step_row, self._col))
+        one_step_row = row + direction
+        if 0 <= one_step_row < 8 and board.is_empty(one_step_row, col):
+            moves.append((one_step_row, col))
 
             # Move forward two squares if at starting pos
             start_row = 1 if self._color == "White" else 6
-            if self._row == start_row:  # Check if in starting position
-                two_step_row = self._row + 2 * direction
-                if board.is_empty(two_step_row, self._col):
-                    moves.append((two_step_row, self._col))
+            if row == start_row:  # Check if in starting position
+                two_step_row = row + 2 * direction
+                if board.is_empty(two_step_row, col):
+                    moves.append((two_step_row, col))
 
         # Diagonal capture mechanism
         for dc in [-1, 1]:
-            diag_row = self._row + direction
-            diag_col = self._col + dc
+            diag_row = row + direction
+            diag_col = col + dc
             if 0 <= diag_row < 8 and 0 <= diag_col < 8:
                 target = board.get_piece(diag_row, diag_col)
                 if target and target.get_color() != self._color:
@@ -138,18 +292,43 @@ class Pawn(ChessPiece):
 
         return moves
 
+    def get_attacks(self, board: Board) -> list[tuple[int, int]]:
+        """
+        Pawns only attack the two squares diagonally forward
+        """
+        row = self._row + (1 if self._color == "White" else -1)
+        if not 0 <= row < board.rows:
+            return []
+        return [(row, col) for col in (self._col - 1, self._col + 1)
+                if 0 <= col < board.cols]
+
+    def get_attack_range(self, direction: tuple[int, int]) -> int:
+        """
+        One square, diagonally forward
+        """
+        forward = 1 if self._color == "White" else -1
+        return 1 if direction in ((forward, -1), (forward, 1)) else 0
+
+    def get_move_mask(self, board: BitBoard) -> int:
+        """
+        Pawn pushes and captures from the bitboards
+        """
+        return board.pawn_moves(self._row * 8 + self._col, self._color)
+
 
 class Queen(ChessPiece):
     """
     Class for Queen pieces
     """
     unit_count = 0
+    __slots__ = ()
 
     def __init__(self, name: str, color: str, row: int, col: int,
                  unit_count_limit: int, movement_count: int,
-                 movement_style: str):
+                 movement_style: str,
+                 store: Optional[PieceStore] = None):
         super().__init__(name, color, row, col, unit_count_limit,
-                         movement_count, movement_style)
+                         movement_count, movement_style, store)
 
     def get_move_directions(self) -> list[tuple[int, int]]:
         """
@@ -172,12 +351,14 @@ class King(ChessPiece):
     Class for King pieces
     """
     unit_count = 0
+    __slots__ = ()
 
     def __init__(self, name: str, color: str, row: int, col: int,
                  unit_count_limit: int, movement_count: int,
-                 movement_style: str):
+                 movement_style: str,
+                 store: Optional[PieceStore] = None):
         super().__init__(name, color, row, col, unit_count_limit,
-                         movement_count, movement_style)
+                         movement_count, movement_style, store)
 
     def get_move_directions(self) -> list[tuple[int, int]]:
         """
@@ -191,18 +372,48 @@ class King(ChessPiece):
     def get_max_steps(self) -> int:
         return 1
 
+    def get_valid_moves(self, board: Board) -> list[tuple[int, int]]:
+        """
+        One step in any direction, from the King lookup table
+        """
+        if isinstance(board, BitBoard):
+            return mask_to_moves(self.get_move_mask(board))
+
+        grid = board.grid
+        moves = []
+        for square in self._targets(KING_TARGETS):
+            target = grid[square[0]][square[1]]
+            if target is None or target._color != self._color:
+                moves.append(square)
+        return moves
+
+    def get_attacks(self, board: Board) -> list[tuple[int, int]]:
+        """
+        Every square of the King lookup table
+        """
+        return list(self._targets(KING_TARGETS))
+
+    def get_move_mask(self, board: BitBoard) -> int:
+        """
+        Precomputed King attack mask minus own pieces
+        """
+        sq = self._row * 8 + self._col
+        return KING_ATTACKS[sq] & ~board.own_mask(self._color)
+
 
 class Bishop(ChessPiece):
     """
     Class for Bishop pieces
     """
     unit_count = 0
+    __slots__ = ()
 
     def __init__(self, name: str, color: str, row: int, col: int,
                  unit_count_limit: int, movement_count: int,
-                 movement_style: str):
+                 movement_style: str,
+                 store: Optional[PieceStore] = None):
         super().__init__(name, color, row, col, unit_count_limit,
-                         movement_count, movement_style)
+                         movement_count, movement_style, store)
 
     def get_move_directions(self) -> list[tuple[int, int]]:
         """
@@ -224,12 +435,14 @@ class Knight(ChessPiece):
     Class for Knight pieces
     """
     unit_count = 0
+    __slots__ = ()
 
     def __init__(self, name: str, color: str, row: int, col: int,
                  unit_count_limit: int, movement_count: int,
-                 movement_style: str):
+                 movement_style: str,
+                 store: Optional[PieceStore] = None):
         super().__init__(name, color, row, col, unit_count_limit,
-                         movement_count, movement_style)
+                         movement_count, movement_style, store)
 
     def get_move_directions(self) -> list[tuple[int, int]]:
         """
@@ -249,31 +462,51 @@ class Knight(ChessPiece):
         """
         Special override to handle Knight movements
         """
-        moves = []
-        knight_moves = self.get_move_directions()
+        if isinstance(board, BitBoard):
+            return mask_to_moves(self.get_move_mask(board))
 
-        for dr, dc in knight_moves:
-            new_row = self._row + dr
-            new_col = self._col + dc
-            if 0 <= new_row < 8 and 0 <= new_col < 8:
-                target = board.get_piece(new_row, new_col)
-                if target is None or target.get_color() != self._color:
-                    moves.append((new_row, new_col))
+        grid = board.grid
+        moves = []
+        for square in self._targets(KNIGHT_TARGETS):
+            target = grid[square[0]][square[1]]
+            if target is None or target._color != self._color:
+                moves.append(square)
 
         return moves
 
+    def get_attacks(self, board: Board) -> list[tuple[int, int]]:
+        """
+        Every square of the Knight lookup table
+        """
+        return list(self._targets(KNIGHT_TARGETS))
+
+    def get_attack_range(self, direction: tuple[int, int]) -> int:
+        """
+        Knights jump once, never along a line
+        """
+        return 1 if direction in self.get_move_directions() else 0
+
+    def get_move_mask(self, board: BitBoard) -> int:
+        """
+        Precomputed Knight attack mask minus own pieces
+        """
+        sq = self._row * 8 + self._col
+        return KNIGHT_ATTACKS[sq] & ~board.own_mask(self._color)
+
 
 class Rook(ChessPiece):
     """
     Class for Rook pieces
     """
     unit_count = 0
+    __slots__ = ()
 
     def __init__(self, name: str, color: str, row: int, col: int,
                  unit_count_limit: int, movement_count: int,
-                 movement_style: str):
+                 movement_style: str,
+                 store: Optional[PieceStore] = None):
         super().__init__(name, color, row, col, unit_count_limit,
-                         movement_count, movement_style)
+                         movement_count, movement_style, store)
 
     def get_move_directions(self) -> list[tuple[int, int]]:
         """
@@ -0,0 +1,39 @@
+from typing import Generic, Hashable, Mapping, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class DirtyTracker(Generic[K]):
+    """
+    Remembers what was last drawn in each region of the screen
+    and reports the regions whose content has changed since
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize with nothing drawn yet
+        """
+        self._shown: dict[K, Hashable] = {}
+        self._full = True
+
+    def invalidate(self) -> None:
+        """
+        Force every region to be reported on the next call to changed
+        """
+        self._full = True
+
+    def changed(self, current: Mapping[K, Hashable]) -> set[K]:
+        """
+        Regions whose state differs from what was last drawn.
+        A region missing from current is treated as empty, so a
+        region that was drawn before and is now missing is dirty too
+        """
+        if self._full:
+            dirty = set(self._shown) | set(current)
+            self._full = False
+        else:
+            dirty = {key for key, state in current.items()
+                     if self._shown.get(key) != state}
+            dirty.update(key for key in self._shown if key not in current)
+        self._shown = dict(current)
+        return dirty
@@ -0,0 +1,119 @@
+from array import array
+from typing import Callable
+from chess_piece import ChessPiece
+
+PROMOTION = "promotion"
+FROZEN = "frozen"
+# Milliseconds an overlay takes to fade out; 100 frames at the old 30 FPS
+EFFECT_DURATION = 100 * 1000 // 30
+FULL_TIMER = 100  # Piece timer of a fresh effect, counting down to 0
+
+# Flag and timer attribute of ChessPiece driven by each effect
+EFFECT_FIELDS = {PROMOTION: ("promoted", "promotion_timer"),
+                 FROZEN: ("frozen", "frozen_timer")}
+
+Effect = tuple[ChessPiece, str]  # (piece, PROMOTION or FROZEN)
+
+
+class EffectSystem:
+    """
+    Counts down every running effect overlay in one array, so a
+    frame costs time per active effect rather than per piece.
+    Effects run on elapsed milliseconds, not frames, and show on the
+    piece as a timer falling from FULL_TIMER to NO_TIMER
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize with no effects running
+        """
+        self.remaining = array("i")  # Milliseconds left for each effect
+        self.durations = array("i")  # Total milliseconds of each effect
+        self._effects: list[Effect] = []
+        self._index: dict[Effect, int] = {}
+        self._listeners: list[Callable[[list[Effect]], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._effects)
+
+    def start(self, piece: ChessPiece, effect: str,
+              duration: int = EFFECT_DURATION) -> None:
+        """
+        Turn effect on for piece for duration milliseconds,
+        restarting it if already running
+        """
+        flag, timer = EFFECT_FIELDS[effect]
+        setattr(piece, flag, True)
+        setattr(piece, timer, FULL_TIMER)
+        duration = max(duration, 1)
+
+        key = (piece, effect)
+        index = self._index.get(key)
+        if index is None:
+            self._index[key] = len(self._effects)
+            self._effects.append(key)
+            self.remaining.append(duration)
+            self.durations.append(duration)
+        else:
+            self.remaining[index] = duration
+            self.durations[index] = duration
+
+    def on_expire(self, listener: Callable[[list[Effect]], None]) -> None:
+        """
+        Call listener with the list of effects that ran out,
+        once per tick in which any did
+        """
+        self._listeners.append(listener)
+
+    def tick(self, elapsed: int) -> list[Effect]:
+        """
+        Advance every active effect by elapsed milliseconds, e.g.
+        clock.get_time(), turn off the ones that ran out and return them
+        """
+        if not self._effects:
+            return []
+
+        remaining = self.remaining = array(
+            "i", [max(t - elapsed, 0) for t in self.remaining])
+        for (piece, effect), left, total in zip(self._effects, remaining,
+                                                self.durations):
+            # Rounded up, so the timer only reaches NO_TIMER at the end
+            timer = (left * FULL_TIMER + total - 1) // total
+            setattr(piece, EFFECT_FIELDS[effect][1], timer)
+
+        if 0 not in remaining:
+            return []
+        expired = [i for i, left in enumerate(remaining) if left == 0]
+        done = [self._effects[i] for i in expired]
+        for index in reversed(expired):
+            self._remove(index)
+        for piece, effect in done:
+            setattr(piece, EFFECT_FIELDS[effect][0], False)
+        for listener in self._listeners:
+            listener(done)
+        return done
+
+    def _remove(self, index: int) -> None:
+        """
+        Drop the effect at index by swapping the last one into its place
+        """
+        last = len(self._effects) - 1
+        del self._index[self._effects[index]]
+        if index != last:
+            moved = self._effects[last]
+            self._effects[index] = moved
+            self.remaining[index] = self.remaining[last]
+            self.durations[index] = self.durations[last]
+            self._index[moved] = index
+        self._effects.pop()
+        self.remaining.pop()
+        self.durations.pop()
+
+    def clear(self) -> None:
+        """
+        Forget every running effect without dispatching it
+        """
+        self.remaining = array("i")
+        self.durations = array("i")
+        self._effects.clear()
+        self._index.clear()
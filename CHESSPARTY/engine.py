@@ -0,0 +1,417 @@
+import copy
+import random
+from array import array
+from typing import Any, NamedTuple, Optional, TextIO
+from board import Board, Move, Square
+from chess_piece import ChessPiece, Pawn, Rook, Knight
+from chess_piece import Bishop, King, Queen
+from event_log import EventLog, LogRecord
+from piece_store import COLORS, KINDS, PieceStore
+from effects import EffectSystem
+from undo import UndoRecord, UndoStep, undo_steps
+from event_classes.base_random_event import RandomEvent
+from event_classes.freeze_piece import FreezePieceEvent
+from event_classes.promote_to_queen import PromoteToQueenEvent
+
+BACK_RANK: list[tuple[type[ChessPiece], str, int, int, int, str]] = [
+    # (class, name, col, unit_count_limit, movement_count, movement_style)
+    (Rook, "Rook", 0, 2, 8, "line"),
+    (Knight, "Knight", 1, 2, 5, "L"),
+    (Bishop, "Bishop", 2, 2, 8, "diagonal"),
+    (Queen, "Queen", 3, 1, 8, "any"),
+    (King, "King", 4, 1, 1, "any"),
+    (Bishop, "Bishop", 5, 2, 8, "diagonal"),
+    (Knight, "Knight", 6, 2, 5, "L"),
+    (Rook, "Rook", 7, 2, 8, "line"),
+]
+
+
+# Constructor arguments of every piece class, by class name:
+# (class, unit_count_limit, movement_count, movement_style)
+PIECE_SPECS: dict[str, tuple[type[ChessPiece], int, int, str]] = {
+    name: (cls, limit, count, style)
+    for cls, name, _, limit, count, style in BACK_RANK}
+PIECE_SPECS["Pawn"] = (Pawn, 8, 1, "forward")
+
+
+class Position(NamedTuple):
+    """
+    Compact, picklable copy of a game position, e.g. to send
+    to another process. pieces packs five ints per piece: kind
+    and color codes (indexes into kinds and colors), row, column
+    and frozen turns
+    """
+    rows: int
+    cols: int
+    turn: str
+    kinds: tuple[str, ...]
+    colors: tuple[str, ...]
+    pieces: bytes
+
+
+def starting_pieces() -> PieceStore:
+    """
+    Standard Chess Party starting layout, White on rows 0-1
+    and Black on rows 6-7
+    """
+    pieces = PieceStore()
+    for color, pawn_row, back_row in (("White", 1, 0), ("Black", 6, 7)):
+        for col in range(8):
+            Pawn("Pawn", color, pawn_row, col, 8, 1, "forward", pieces)
+        for cls, name, col, limit, count, style in BACK_RANK:
+            cls(name, color, back_row, col, limit, count, style, pieces)
+    return pieces
+
+
+class GameEngine:
+    """
+    Pure-Python Chess Party game state and turn logic,
+    usable with or without the pygame front-end
+    """
+
+    def __init__(self, seed: Optional[int] = None,
+                 rows: int = 8, cols: int = 8,
+                 event_chance: float = 0.5, queen_limit: int = 4,
+                 log_capacity: int = 256,
+                 log_sink: Optional[TextIO] = None) -> None:
+        """
+        Initialize a new game
+
+        Args:
+            seed (int): seed for the random events, None for random
+            rows (int): board rows
+            cols (int): board columns
+            event_chance (float): chance a random turn fires an event
+            queen_limit (int): most Queens PromoteToQueenEvent allows
+            log_capacity (int): most log records kept in memory
+            log_sink (TextIO): open file streaming every log record
+        """
+        self.rows = rows
+        self.cols = cols
+        self.event_chance = event_chance
+        self.queen_limit = queen_limit
+        self.rng = random.Random(seed)
+        self.event_log = EventLog(log_capacity, log_sink)
+        self.effects = EffectSystem()
+        self.reset(seed)
+
+    def reset(self, seed: Optional[int] = None,
+              pieces: Optional[PieceStore] = None) -> None:
+        """
+        Put every piece back on its starting square, or set up
+        pieces instead, and clear the turn, captures, log, effects
+        and winner
+        """
+        if seed is not None:
+            self.rng.seed(seed)
+        self.pieces = starting_pieces() if pieces is None else pieces
+        self.board = Board(self.pieces, self.rows, self.cols)
+        self.effects.clear()
+        self.events = self._new_events()
+        self.event_counts: dict[str, int] = {}
+        self.current_turn = "White"
+        self.captured_white: list[ChessPiece] = []
+        self.captured_black: list[ChessPiece] = []
+        self.event_log.clear()
+        self.winner: Optional[str] = None
+        self.game_over = False
+        self.turn_count = 0
+        self.undo_stack: list[UndoRecord] = []
+        self._quiet = False  # Set while a search makes moves
+
+    def _new_events(self) -> list[RandomEvent]:
+        """
+        Random events acting on this engine's board and effects
+        """
+        return [FreezePieceEvent(board=self.board, effects=self.effects),
+                PromoteToQueenEvent(self.board, self.queen_limit,
+                                    self.effects)]
+
+    def copy(self) -> "GameEngine":
+        """
+        Independent engine in the same position, e.g. for searching
+        it off the UI thread. The copy starts with an empty log, no
+        effects and nothing to undo
+        """
+        clone = copy.copy(self)
+        clone.rng = random.Random()
+        clone.rng.setstate(self.rng.getstate())
+        clone.event_log = EventLog(self.event_log.capacity)
+        clone.effects = EffectSystem()
+        clone.pieces = self.pieces.copy()
+        clone.board = Board(clone.pieces, self.rows, self.cols)
+        clone.events = clone._new_events()
+        clone.event_counts = dict(self.event_counts)
+        clone.captured_white = list(self.captured_white)
+        clone.captured_black = list(self.captured_black)
+        clone.undo_stack = []
+        clone._quiet = False
+        return clone
+
+    def position(self) -> Position:
+        """
+        The current position, packed from the store columns
+        """
+        store = self.pieces
+        values = array("i")
+        for piece_values in zip(store.kinds, store.colors, store.rows,
+                                store.cols, store.frozen_turns):
+            values.extend(piece_values)
+        return Position(self.rows, self.cols, self.current_turn,
+                        tuple(cls.__name__ for cls in KINDS),
+                        tuple(COLORS), values.tobytes())
+
+    @classmethod
+    def from_position(cls, position: Position,
+                      **options: Any) -> "GameEngine":
+        """
+        New engine set up in position, with the pieces it names.
+        options are passed on to the constructor
+        """
+        engine = cls(rows=position.rows, cols=position.cols, **options)
+        values = array("i")
+        values.frombytes(position.pieces)
+        pieces = PieceStore()
+        for index in range(0, len(values), 5):
+            kind, color, row, col, frozen = values[index:index + 5]
+            name = position.kinds[kind]
+            piece_cls, limit, count, style = PIECE_SPECS[name]
+            piece = piece_cls(name, position.colors[color], row, col,
+                              limit, count, style, pieces)
+            piece._frozen_turns = frozen
+        engine.reset(pieces=pieces)
+        engine.current_turn = position.turn
+        return engine
+
+    def piece_at(self, row: int, col: int) -> Optional[ChessPiece]:
+        """
+        Piece standing on (row, col), if any
+        """
+        return self.board.get_piece(row, col)
+
+    def can_move(self, piece: ChessPiece) -> bool:
+        """
+        True if piece belongs to the side to move and is not frozen
+        """
+        return (not self.game_over
+                and piece.get_color() == self.current_turn
+                and not piece.is_frozen())
+
+    def valid_moves(self, piece: ChessPiece) -> list[Square]:
+        """
+        Legal target squares for piece in the current position
+        """
+        return self.board.legal_targets(piece)
+
+    def available_moves(self) -> list[Move]:
+        """
+        Every legal move for the side to move
+        """
+        if self.game_over:
+            return []
+        return self.board.legal_moves(self.current_turn)
+
+    def step(self, move: Move) -> bool:
+        """
+        Play move for the side to move, then a random turn, then
+        look for check, checkmate and stalemate on the other side.
+        Returns False (and changes nothing) if the move is not legal
+        """
+        return self._play(move, random_turn=True)
+
+    def make_move(self, move: Move, random_turn: bool = False) -> bool:
+        """
+        Play move like step, pushing a record of every change onto
+        undo_stack for unmake_move. The random turn and the event log
+        only run if random_turn, so a search sees just the move
+        """
+        record = self._record(move, random_turn)
+        self._set_journal(record.steps)
+        self._quiet = not random_turn
+        try:
+            played = self._play(move, random_turn)
+        finally:
+            self._set_journal(None)
+            self._quiet = False
+        if played:
+            self.undo_stack.append(record)
+        return played
+
+    def make_random_turn(self) -> list[str]:
+        """
+        random_turn, pushing a record onto undo_stack like make_move
+        so that unmake_move can take it back too
+        """
+        record = self._record(None, True)
+        self._set_journal(record.steps)
+        try:
+            messages = self.random_turn()
+        finally:
+            self._set_journal(None)
+        self.undo_stack.append(record)
+        return messages
+
+    def _record(self, move: Optional[Move],
+                random_turn: bool) -> UndoRecord:
+        """
+        Empty undo record holding the state before move
+        """
+        return UndoRecord(
+            move, self.current_turn, self.turn_count, self.winner,
+            self.game_over, len(self.captured_white),
+            len(self.captured_black),
+            self.rng.getstate() if random_turn else None,
+            dict(self.event_counts) if random_turn else None, [])
+
+    def unmake_move(self) -> Optional[Move]:
+        """
+        Take back the last make_move or make_random_turn and return
+        its move, None for a random turn. Effect overlays and log
+        records of its events are left in place.
+        Raises IndexError if there is nothing to take back
+        """
+        record = self.undo_stack.pop()
+        undo_steps(record.steps)
+        self.current_turn = record.turn
+        self.turn_count = record.turn_count
+        self.winner = record.winner
+        self.game_over = record.game_over
+        del self.captured_white[record.captured_white:]
+        del self.captured_black[record.captured_black:]
+        if record.rng_state is not None:
+            self.rng.setstate(record.rng_state)
+        if record.event_counts is not None:
+            self.event_counts = record.event_counts
+        return record.move
+
+    def _set_journal(self, journal: Optional[list[UndoStep]]) -> None:
+        """
+        Point the board and the pieces at journal, None to stop
+        """
+        self.board.journal = self.pieces.journal = journal
+
+    def _play(self, move: Move, random_turn: bool) -> bool:
+        """
+        Shared body of step and make_move
+        """
+        (from_row, from_col), target = move
+        piece = self.board.get_piece(from_row, from_col)
+        if piece is None or not self.can_move(piece):
+            return False
+        if target not in self.board.legal_targets(piece):
+            return False
+
+        captured = self.board.move_piece(piece, *target)
+        if captured is not None:
+            self._capture(piece, captured, (from_row, from_col), target)
+
+        if random_turn:
+            self.random_turn()
+        ct = self.current_turn
+        self.current_turn = "Black" if ct == "White" else "White"
+        self.turn_count += 1
+        self._check_status()
+        return True
+
+    def _check_status(self) -> None:
+        """
+        Log a check on the side to move, and end the game
+        if that side is checkmated or stalemated
+        """
+        if self.game_over:
+            return
+        turn = self.current_turn
+        check = self.board.in_check(turn)
+        if self.board.has_legal_move(turn):
+            if check:
+                self._log("check", f"{turn} is in check.")
+            return
+
+        self.game_over = True
+        if check:
+            self.winner = "Black" if turn == "White" else "White"
+            self._log("checkmate", f"Checkmate! {self.winner} wins.")
+        else:
+            self._log("stalemate", "Stalemate! The game is a draw.")
+
+    def _log(self, kind: str, message: str,
+             piece: Optional[ChessPiece] = None,
+             *squares: Square) -> None:
+        """
+        Append a record for the current turn to the event log,
+        unless a search is making moves
+        """
+        if self._quiet:
+            return
+        name = None
+        if piece is not None:
+            name = f"{piece.get_color()} {piece.get_name()}"
+        self.event_log.append(LogRecord(self.turn_count, kind, message,
+                                        name, squares))
+
+    def _capture(self, piece: ChessPiece, captured: ChessPiece,
+                 start: Square, square: Square) -> None:
+        """
+        Record a captured piece and end the game if it was a King
+        """
+        self._log("capture", f"{piece.get_color()}"
+                  f"{piece.get_name()}"
+                  f" captured {captured.get_color()}"
+                  f"{captured.get_name()}"
+                  f"at ({square[0]}, {square[1]})", piece, start, square)
+        if captured.get_color() == "White":
+            self.captured_white.append(captured)
+        else:
+            self.captured_black.append(captured)
+        self.pieces.remove(captured)
+
+        if captured.get_name() == "King":
+            loser = captured.get_color()
+            self.winner = "Black" if loser == "White" else "White"
+            self.game_over = True
+            self._log("checkmate", f"Checkmate! {self.winner} wins.",
+                      captured, square)
+
+    def random_turn(self) -> list[str]:
+        """
+        Random Chess Party turn: pick a non-frozen piece, count down
+        every freeze, then either fire a random event on the piece
+        or report its valid moves. Messages are logged and returned
+        """
+        messages = []
+
+        # Randomly select non-frozen piece
+        store = self.pieces
+        movable_pieces = [p for p, turns in zip(store, store.frozen_turns)
+                          if not turns]
+        if not movable_pieces:
+            messages.append("All pieces are frozen!")
+            self._log("all_frozen", messages[-1])
+            return messages
+
+        selected_piece = self.rng.choice(movable_pieces)
+
+        # Reduce frozen turns by 1
+        frozen = [p for p, turns in zip(store, store.frozen_turns) if turns]
+        for piece in frozen:
+            self.board.reduce_frozen(piece)
+            messages.append(f"{piece._name} is frozen.")
+            self._log("frozen", messages[-1], piece,
+                      (piece._row, piece._col))
+
+        if self.rng.random() < self.event_chance:
+            event = self.rng.choice(self.events)
+            name = type(event).__name__
+            self.event_counts[name] = self.event_counts.get(name, 0) + 1
+            square = (selected_piece._row, selected_piece._col)
+            messages.append(event.apply(selected_piece, self.pieces))
+            self._log(name, messages[-1], selected_piece, square)
+        else:
+            valid_moves = self.board.get_valid_moves(selected_piece)
+            messages.append(f"{selected_piece._name} "
+                            f"valid moves: {valid_moves}")
+            self._log("moves", messages[-1], selected_piece,
+                      (selected_piece._row, selected_piece._col),
+                      *valid_moves)
+
+        return messages
@@ -1,10 +1,10 @@
 from abc import ABC, abstractmethod
 from chess_piece import ChessPiece
-from typing import List, Optional
+from typing import MutableSequence, Optional
 
 
 class RandomEvent(ABC):
     @abstractmethod
     def apply(self, piece: ChessPiece,
-              pieces: Optional[List[ChessPiece]] = None) -> str:
+              pieces: Optional[MutableSequence[ChessPiece]] = None) -> str:
         pass
@@ -1,52 +1,76 @@
 # explosion.py
+from typing import Callable, MutableSequence
 from board import Board
 from chess_piece import ChessPiece
 
+# Which offsets (row, col) within radius r each blast shape covers
+SHAPES: dict[str, Callable[[int, int, int], bool]] = {
+    "square": lambda dr, dc, r: True,
+    "diamond": lambda dr, dc, r: abs(dr) + abs(dc) <= r,
+    "circle": lambda dr, dc, r: dr * dr + dc * dc <= r * r,
+    "cross": lambda dr, dc, r: dr == 0 or dc == 0,
+}
+
 
 class Explosion:
     """
-    Explosions effect a 3x3 area centered at the given tile.
+    Explosions effect an area centered at the given tile,
+    a 3x3 square by default.
     """
 
-    def __init__(self, board: Board) -> None:
+    def __init__(self, board: Board, radius: int = 1,
+                 shape: str = "square") -> None:
         """
         initialize the explosion manager with the board reference.
 
         Args:
             board (Board): The current game board instance.
+            radius (int): how many tiles the blast reaches from its center
+            shape (str): "square", "diamond", "circle" or "cross"
         """
+        if shape not in SHAPES:
+            raise ValueError(f"Unknown explosion shape: {shape}")
         self.board = board
+        self.radius = radius
+        self.shape = shape
+        covers = SHAPES[shape]
+        self.offsets = [(dr, dc)
+                        for dr in range(-radius, radius + 1)
+                        for dc in range(-radius, radius + 1)
+                        if covers(dr, dc, radius)]
+
+    def blast_area(self, row: int, col: int) -> list[tuple[int, int]]:
+        """
+        Tiles on the board covered by an explosion at row, col
+        """
+        rows, cols = self.board.rows, self.board.cols
+        return [(row + dr, col + dc) for dr, dc in self.offsets
+                if 0 <= row + dr < rows and 0 <= col + dc < cols]
 
     def trigger(self, row: int, col: int,
-                pieces: list[ChessPiece]) -> list[ChessPiece]:
+                pieces: MutableSequence[ChessPiece]
+                ) -> MutableSequence[ChessPiece]:
         """
-        trigger an explosion centered at row, col. Any piece in the 3x3
-        area around this tile is removed from the board
+        trigger an explosion centered at row, col. Any piece in the
+        blast area is removed from the board and from pieces. Only the
+        tiles in the area are looked at, and with a PieceStore each
+        removal is O(1), so the cost follows the blast size
 
         Args:
             row (int): center row of explosion
             col (int): center column of explosion
-            pieces (list): the list of current pieces on the board
+            pieces (MutableSequence): the current pieces, updated in place
 
         Returns:
-            list: Updated list of pieces after the explosion.
+            MutableSequence: pieces, after the explosion.
         """
-        effected_positions = [
-            (r, c)
-            for r in range(row - 1, row + 2)
-            for c in range(col - 1, col + 2)
-            if 0 <= r < self.board.rows and 0 <= c < self.board.cols
-        ]
-
-        # Filter out any pieces that are at the effected positions
-        new_pieces = []
-        for piece in pieces:
-            if (piece._row, piece._col) not in effected_positions:
-                new_pieces.append(piece)
-            else:
+        grid = self.board.grid
+        for r, c in self.blast_area(row, col):
+            piece = grid[r][c]
+            if piece is not None:
                 # Remove piece from grid and board_state
-                self.board.grid[piece._row][piece._col] = None
-                bbs = self.board.board_state
-                bbs[piece._row][piece._col].set_piece_in_place(False)
+                self.board.remove_piece(piece)
+                if piece in pieces:
+                    pieces.remove(piece)
 
-        return new_pieces
+        return pieces
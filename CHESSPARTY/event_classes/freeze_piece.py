@@ -1,15 +1,26 @@
-from typing import Optional
+from typing import MutableSequence, Optional
 from event_classes.base_random_event import RandomEvent
+from board import Board
 from chess_piece import ChessPiece
+from effects import EffectSystem, FROZEN
 
 
 class FreezePieceEvent(RandomEvent):
-    def __init__(self, turns: int = 1):
+    def __init__(self, turns: int = 1, board: Optional[Board] = None,
+                 effects: Optional[EffectSystem] = None):
         self.turns = turns
+        self.board = board
+        self.effects = effects
 
     def apply(self, piece: ChessPiece,
-              pieces: Optional[list[ChessPiece]] = None) -> str:
-        piece.freeze(self.turns)
-        piece.frozen = True
-        piece.frozen_timer = 100
+              pieces: Optional[MutableSequence[ChessPiece]] = None) -> str:
+        if self.board is not None:
+            self.board.freeze_piece(piece, self.turns)
+        else:
+            piece.freeze(self.turns)
+        if self.effects is not None:
+            self.effects.start(piece, FROZEN)
+        else:
+            piece.frozen = True
+            piece.frozen_timer = 100
         return f"{piece.get_name()} is frozen for {self.turns} turn(s)!"
@@ -1,39 +1,64 @@
-from typing import Optional
+from typing import MutableSequence, Optional
 from event_classes.base_random_event import RandomEvent
+from board import Board
 from chess_piece import ChessPiece, Queen
+from effects import EffectSystem, PROMOTION
+from piece_store import PieceStore
 
 
 class PromoteToQueenEvent(RandomEvent):
     """
     Promotes a random unit to a Queen if there
-    are not already four Queens on the board.
+    are not already four (queen_limit) Queens on the board.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, board: Optional[Board] = None,
+                 queen_limit: int = 4,
+                 effects: Optional[EffectSystem] = None) -> None:
         """
         Initialize QueenEvent random event
+
+        Args:
+            board (Board): optional long-lived board to keep in sync
+            queen_limit (int): most Queens allowed on the board
+            effects (EffectSystem): optional system running the
+                                    promotion overlay
         """
-        self._queen_limit = 4
+        self._queen_limit = queen_limit
+        self.board = board
+        self.effects = effects
 
     def apply(self, piece: ChessPiece,
-              pieces: Optional[list[ChessPiece]] = None) -> str:
+              pieces: Optional[MutableSequence[ChessPiece]] = None) -> str:
         """
-        Apply promotion if not already 4 Queens on board
+        Apply promotion if there are fewer Queens on the board
+        than the limit
         """
         if pieces is None:
             return "Promotion failed -- no list provided for pieces"
 
-        if Queen.get_unit_count() != self._queen_limit:
+        # Count Queens in play; Queen.unit_count never goes down, so it
+        # stops meaning anything once Queens are captured or games restart
+        if isinstance(pieces, PieceStore):
+            queens = pieces.count_kind(Queen)
+        else:
+            queens = sum(1 for p in pieces if isinstance(p, Queen))
+        if queens < self._queen_limit:
             new_queen = Queen("Queen", piece.get_color(),
                               piece._row, piece._col,
                               1, 8, "any")
 
-            new_queen.promoted = True
-            new_queen.promotion_timer = 100
+            if self.effects is not None:
+                self.effects.start(new_queen, PROMOTION)
+            else:
+                new_queen.promoted = True
+                new_queen.promotion_timer = 100
 
-            # Replace promoted unit with new Queen unit
+            # Replace promoted unit with new Queen unit, O(1) in a store
             index = pieces.index(piece)
             pieces[index] = new_queen
+            if self.board is not None:
+                self.board.place_piece(new_queen)
 
             promoted_str: str = "has been promoted to Queen!"
             return f"{piece.get_color()} {piece.get_name()} {promoted_str}"
@@ -0,0 +1,91 @@
+import json
+from collections import deque
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple, Optional, TextIO
+
+Square = tuple[int, int]
+
+
+class LogRecord(NamedTuple):
+    """
+    One thing that happened during a game
+    """
+    turn: int
+    kind: str  # "capture", "checkmate", "moves", "frozen", event class
+    message: str
+    piece: Optional[str] = None  # e.g. "White Rook"
+    squares: tuple[Square, ...] = ()
+
+    def to_json(self) -> str:
+        """
+        Record as a single line of JSON
+        """
+        return json.dumps(self._asdict())
+
+    @classmethod
+    def from_json(cls, line: str) -> "LogRecord":
+        """
+        Record from a line written by to_json
+        """
+        data = json.loads(line)
+        data["squares"] = tuple((row, col) for row, col in data["squares"])
+        return cls(**data)
+
+
+class EventLog:
+    """
+    Fixed-capacity ring buffer of the most recent log records,
+    optionally streaming every record to a file as JSON lines
+    """
+
+    def __init__(self, capacity: int = 256,
+                 sink: Optional[TextIO] = None) -> None:
+        """
+        Initialize an empty log
+
+        Args:
+            capacity (int): most records kept in memory
+            sink (TextIO): open text file receiving every record
+        """
+        self.capacity = capacity
+        self.sink = sink
+        self._records: deque[LogRecord] = deque(maxlen=capacity)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        return iter(self._records)
+
+    def append(self, record: LogRecord) -> None:
+        """
+        Add record, dropping the oldest one once the log is full
+        """
+        self._records.append(record)
+        if self.sink is not None:
+            self.sink.write(record.to_json() + "\n")
+
+    def messages(self, last: Optional[int] = None) -> list[str]:
+        """
+        Messages of the last records kept, oldest first,
+        or of every record kept if last is None
+        """
+        if last is None:
+            return [record.message for record in self._records]
+        newest = islice(reversed(self._records), max(last, 0))
+        return [record.message for record in newest][::-1]
+
+    def clear(self) -> None:
+        """
+        Drop the records kept in memory; the sink is left open
+        """
+        self._records.clear()
+
+
+def read_log(lines: Iterable[str]) -> Iterator[LogRecord]:
+    """
+    Replay the records streamed to a sink, e.g. read_log(open(path))
+    """
+    for line in lines:
+        if line.strip():
+            yield LogRecord.from_json(line)
@@ -0,0 +1,50 @@
+class AdaptiveFrameRate:
+    """
+    Picks the frame rate for the main loop: fast while something
+    moves on screen or the player is interacting, and idle once
+    everything has been still for a while. While idle the loop should
+    block waiting for input, waking at most idle_fps times a second
+    """
+
+    def __init__(self, idle_fps: int = 1, active_fps: int = 60,
+                 linger: int = 500) -> None:
+        """
+        Initialize at the active frame rate
+
+        Args:
+            idle_fps (int): frame rate while nothing animates
+            active_fps (int): frame rate during drags, overlays and input;
+                              equal to idle_fps for a fixed frame rate
+            linger (int): milliseconds to stay fast after the last
+                          activity, so a burst of input feels smooth
+        """
+        self.idle_fps = idle_fps
+        self.active_fps = active_fps
+        self.linger = linger
+        self.fps = active_fps
+        self._still = 0  # Milliseconds since the last activity
+
+    def update(self, active: bool, elapsed: int) -> int:
+        """
+        Frame rate for the next frame, given whether anything animated
+        or happened this frame and the milliseconds it took
+        """
+        self._still = 0 if active else self._still + elapsed
+        self.fps = self.idle_fps if self.idle else self.active_fps
+        return self.fps
+
+    @property
+    def idle(self) -> bool:
+        """
+        True once nothing has happened for linger milliseconds,
+        never at a fixed frame rate
+        """
+        return (self._still >= self.linger
+                and self.idle_fps < self.active_fps)
+
+    @property
+    def timeout(self) -> int:
+        """
+        Longest wait for input while idle, in milliseconds
+        """
+        return 1000 // self.idle_fps
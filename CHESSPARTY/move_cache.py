@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+
+class MoveCache:
+    """
+    Bounded least-recently-used cache of generated moves
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        """
+        Initialize an empty cache holding at most capacity entries
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[
+            Hashable, tuple[tuple[int, int], ...]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[list[tuple[int, int]]]:
+        """
+        Return a copy of the cached moves for key, or None
+        """
+        moves = self._entries.get(key)
+        if moves is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return list(moves)
+
+    def put(self, key: Hashable, moves: list[tuple[int, int]]) -> None:
+        """
+        Store moves for key, evicting the least recently used entry
+        once the cache is full
+        """
+        self._entries[key] = tuple(moves)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop every entry
+        """
+        self._entries.clear()
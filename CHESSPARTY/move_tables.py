@@ -0,0 +1,57 @@
+"""
+Lookup tables for move generation, built once at import.
+
+Squares are (row, col) tuples on the standard 8x8 board, so the
+move generators can append them directly without re-checking bounds.
+"""
+
+SIZE = 8
+
+Square = tuple[int, int]
+Direction = tuple[int, int]
+
+ROOK_DIRECTIONS: list[Direction] = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+BISHOP_DIRECTIONS: list[Direction] = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+QUEEN_DIRECTIONS: list[Direction] = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+KNIGHT_OFFSETS: list[Direction] = [(2, 1), (1, 2), (-1, 2), (-2, 1),
+                                   (-2, -1), (2, -1), (-1, -2), (1, -2)]
+
+
+def build_ray(row: int, col: int, dr: int, dc: int) -> tuple[Square, ...]:
+    """
+    Ordered squares from (row, col) to the edge of the board
+    in direction (dr, dc), excluding the starting square
+    """
+    ray = []
+    r, c = row + dr, col + dc
+    while 0 <= r < SIZE and 0 <= c < SIZE:
+        ray.append((r, c))
+        r, c = r + dr, c + dc
+    return tuple(ray)
+
+
+def build_jumps(row: int, col: int,
+                offsets: list[Direction]) -> tuple[Square, ...]:
+    """
+    On-board squares one offset away from (row, col)
+    """
+    return tuple((row + dr, col + dc) for dr, dc in offsets
+                 if 0 <= row + dr < SIZE and 0 <= col + dc < SIZE)
+
+
+# RAYS[row][col][direction] -> ordered squares along that direction
+RAYS: list[list[dict[Direction, tuple[Square, ...]]]] = [
+    [{d: build_ray(row, col, *d) for d in QUEEN_DIRECTIONS}
+     for col in range(SIZE)]
+    for row in range(SIZE)
+]
+
+# KNIGHT_TARGETS[row][col] / KING_TARGETS[row][col] -> reachable squares
+KNIGHT_TARGETS: list[list[tuple[Square, ...]]] = [
+    [build_jumps(row, col, KNIGHT_OFFSETS) for col in range(SIZE)]
+    for row in range(SIZE)
+]
+KING_TARGETS: list[list[tuple[Square, ...]]] = [
+    [build_jumps(row, col, QUEEN_DIRECTIONS) for col in range(SIZE)]
+    for row in range(SIZE)
+]
@@ -0,0 +1,159 @@
+"""
+Perft: move generator correctness and speed.
+
+perft counts the leaf nodes of the legal move tree to a fixed depth,
+making and unmaking every move on one GameEngine. The counts from the
+starting layout match standard chess, so any change to a piece's
+get_valid_moves, the attack maps or the legality filter that moves a
+count is a bug. POSITIONS stores more layouts with their known counts.
+Random turns are left out; they are not part of move generation.
+Example:
+
+    python3 perft.py --depth 4 --position start
+"""
+
+import argparse
+import time
+from typing import NamedTuple, Optional
+from board import Move
+from engine import GameEngine, PIECE_SPECS
+from piece_store import PieceStore
+
+# Layout letters, as in FEN: upper case for White, lower case for Black
+LETTERS = {"P": "Pawn", "N": "Knight", "B": "Bishop",
+           "R": "Rook", "Q": "Queen", "K": "King"}
+
+
+class PerftPosition(NamedTuple):
+    """
+    Stored perft position and its known leaf counts
+    """
+    name: str
+    layout: str  # See load_layout
+    nodes: tuple[int, ...]  # Leaf counts at depth 1, 2, ...
+
+
+# Counts follow Chess Party rules: no castling, en passant or promotion
+# by move. They agree with standard chess from the start; endgame is
+# the usual perft position 3 and comes out short by its en passant
+# captures (2 at depth 3)
+POSITIONS = [
+    PerftPosition("start",
+                  "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w",
+                  (20, 400, 8902, 197281)),
+    PerftPosition("middlegame",
+                  "r1bq1rk1/pppp1ppp/2n2n2/2b1p3/2B1P3/2NP1N2/PPP2PPP/"
+                  "R1BQ1RK1 w",
+                  (37, 1183, 42968, 1375268)),
+    PerftPosition("endgame",
+                  "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w",
+                  (14, 191, 2810, 43087)),
+]
+
+
+def load_layout(layout: str) -> GameEngine:
+    """
+    New engine without random events set up from layout: the first
+    two fields of a FEN string, piece placement from Black's back
+    rank down and then w or b for the side to move.
+    Raises ValueError if layout cannot be read
+    """
+    placement, turn = layout.split()
+    ranks = placement.split("/")
+    if len(ranks) != 8 or turn not in ("w", "b"):
+        raise ValueError(f"cannot read layout {layout!r}")
+    pieces = PieceStore()
+    for rank, squares in enumerate(ranks):
+        row = 7 - rank
+        col = 0
+        for letter in squares:
+            if letter.isdigit():
+                col += int(letter)
+                continue
+            name = LETTERS.get(letter.upper())
+            if name is None:
+                raise ValueError(f"unknown piece {letter!r} in {layout!r}")
+            color = "White" if letter.isupper() else "Black"
+            cls, limit, count, style = PIECE_SPECS[name]
+            cls(name, color, row, col, limit, count, style, pieces)
+            col += 1
+        if col != 8:
+            raise ValueError(f"rank {8 - rank} of {layout!r} is not 8 wide")
+    engine = GameEngine(event_chance=0.0)
+    engine.reset(pieces=pieces)
+    engine.current_turn = "White" if turn == "w" else "Black"
+    return engine
+
+
+def perft(engine: GameEngine, depth: int) -> int:
+    """
+    Number of legal move sequences depth plies long from engine's
+    position, which is left as it was
+    """
+    if depth == 0:
+        return 1
+    moves = engine.available_moves()
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        engine.make_move(move)
+        nodes += perft(engine, depth - 1)
+        engine.unmake_move()
+    return nodes
+
+
+def divide(engine: GameEngine, depth: int) -> dict[Move, int]:
+    """
+    perft split by first move, to find the move a wrong count is under
+    """
+    counts = {}
+    for move in engine.available_moves():
+        engine.make_move(move)
+        counts[move] = perft(engine, depth - 1)
+        engine.unmake_move()
+    return counts
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Command line entry point. Exits with an error if a count
+    differs from the stored one
+    """
+    names = [position.name for position in POSITIONS]
+    parser = argparse.ArgumentParser(description="Chess Party perft")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--position", choices=names + ["all"],
+                        default="all")
+    parser.add_argument("--divide", action="store_true",
+                        help="print the count under each first move")
+    args = parser.parse_args(argv)
+
+    failed = []
+    for position in POSITIONS:
+        if args.position not in ("all", position.name):
+            continue
+        engine = load_layout(position.layout)
+        start = time.perf_counter()
+        if args.divide:
+            counts = divide(engine, args.depth)
+            for move, count in sorted(counts.items()):
+                print(f"  {move}: {count}")
+            nodes = sum(counts.values())
+        else:
+            nodes = perft(engine, args.depth)
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        line = (f"{position.name:<12} depth {args.depth}: {nodes} nodes"
+                f" in {elapsed:.2f}s ({nodes / elapsed:.0f} nodes/sec)")
+        if 0 < args.depth <= len(position.nodes):
+            expected = position.nodes[args.depth - 1]
+            if nodes != expected:
+                line += f" expected {expected}"
+                failed.append(position.name)
+        print(line)
+    if failed:
+        parser.exit(1, f"wrong node counts: {', '.join(failed)}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""
+Struct-of-arrays storage for a whole army of chess pieces.
+
+Every mutable field of a piece (square, color, freeze counter, effect
+flags and timers) lives in one typed array per field, one entry per
+piece. Piece objects are views onto one index of their store, so a
+position is cloned by copying a handful of arrays, and a pass over one
+field walks a compact array instead of every piece object.
+
+Removal swaps the last piece into the hole: it is O(1) but does not keep
+the order of the remaining pieces. A piece outside any store, built
+without one or removed, keeps its state in a PieceRow of its own that
+goes away with it. Handles are integers that stay the same for as long
+as a piece is in the store, whatever gets swapped.
+While a journal is set, append, removals and replacements record how to
+take them back, order included; a piece put back gets a new handle.
+"""
+
+from array import array
+from typing import (TYPE_CHECKING, Iterable, Iterator, MutableSequence,
+                    Optional, Union, cast, overload)
+from undo import UndoStep
+
+if TYPE_CHECKING:
+    from chess_piece import ChessPiece
+
+COLORS = ["White", "Black"]  # Color of each color code
+
+# Column names, in the order of a row of values
+COLUMNS = ("kinds", "colors", "rows", "cols", "frozen_turns",
+           "promoted", "frozen", "promotion_timers", "frozen_timers")
+
+KINDS: list[type["ChessPiece"]] = []  # Piece class of each kind code
+
+
+def kind_code(cls: type["ChessPiece"]) -> int:
+    """
+    Small integer standing for piece class cls in the kinds column
+    """
+    if cls not in KINDS:
+        KINDS.append(cls)
+    return KINDS.index(cls)
+
+
+def color_code(color: str) -> int:
+    """
+    Small integer standing for color in the colors column
+    """
+    if color not in COLORS:
+        COLORS.append(color)
+    return COLORS.index(color)
+
+
+class PieceRow:
+    """
+    State of one piece outside any store: one single-entry column
+    per field, so the piece reads it like a store at index 0
+    """
+    __slots__ = COLUMNS
+    kinds: list[int]
+    colors: list[int]
+    rows: list[int]
+    cols: list[int]
+    frozen_turns: list[int]
+    promoted: list[int]
+    frozen: list[int]
+    promotion_timers: list[int]
+    frozen_timers: list[int]
+
+    def __init__(self, piece: "ChessPiece", values: Iterable[int]) -> None:
+        """
+        Hold values, one per column, and point piece at this row
+        """
+        (self.kinds, self.colors, self.rows, self.cols, self.frozen_turns,
+         self.promoted, self.frozen, self.promotion_timers,
+         self.frozen_timers) = ([value] for value in values)
+        piece._store = self
+        piece._index = 0
+
+    def _pop(self, index: int) -> tuple[int, ...]:
+        """
+        The values of the piece, as it joins a store
+        """
+        return (self.kinds[0], self.colors[0], self.rows[0], self.cols[0],
+                self.frozen_turns[0], self.promoted[0], self.frozen[0],
+                self.promotion_timers[0], self.frozen_timers[0])
+
+
+class PieceStore(MutableSequence["ChessPiece"]):
+    """
+    List-compatible collection of pieces backed by parallel arrays
+    """
+
+    def __init__(self, pieces: Iterable["ChessPiece"] = ()) -> None:
+        """
+        Initialize the store, moving pieces into it from their old stores
+        """
+        self.kinds = array("B")
+        self.colors = array("B")
+        self.rows = array("h")
+        self.cols = array("h")
+        self.frozen_turns = array("i")
+        self.promoted = array("B")
+        self.frozen = array("B")
+        self.promotion_timers = array("i")
+        self.frozen_timers = array("i")
+        self._pieces: list["ChessPiece"] = []
+        self._handles = array("i")  # Handle of the piece at each index
+        self._index_of: dict[int, int] = {}  # Index of each handle
+        self._next_handle = 0
+        self.journal: Optional[list[UndoStep]] = None
+        self.extend(pieces)
+
+    def _columns(self) -> list["array[int]"]:
+        return [self.kinds, self.colors, self.rows, self.cols,
+                self.frozen_turns, self.promoted, self.frozen,
+                self.promotion_timers, self.frozen_timers]
+
+    def _new_handle(self, index: int) -> int:
+        handle = self._next_handle
+        self._next_handle += 1
+        self._index_of[handle] = index
+        return handle
+
+    def _push(self, piece: "ChessPiece", values: Iterable[int]) -> None:
+        """
+        Add piece with one value per column and point it at this store
+        """
+        for column, value in zip(self._columns(), values):
+            column.append(value)
+        index = len(self._pieces)
+        self._handles.append(self._new_handle(index))
+        self._pieces.append(piece)
+        piece._store = self
+        piece._index = index
+
+    def _pop(self, index: int) -> tuple[int, ...]:
+        """
+        Take the piece at index out by swapping the last piece into
+        its place. Returns the values the piece had
+        """
+        columns = self._columns()
+        values = tuple(column[index] for column in columns)
+        del self._index_of[self._handles[index]]
+        last = len(self._pieces) - 1
+        if index != last:
+            for column in columns:
+                column[index] = column[last]
+            moved = self._pieces[last]
+            moved._index = index
+            self._pieces[index] = moved
+            self._handles[index] = self._handles[last]
+            self._index_of[self._handles[index]] = index
+        for column in columns:
+            column.pop()
+        self._handles.pop()
+        self._pieces.pop()
+        return values
+
+    def _release(self, index: int) -> "ChessPiece":
+        """
+        Remove the piece at index, moving its state to a PieceRow
+        so it keeps it after leaving this store
+        """
+        piece = self._pieces[index]
+        PieceRow(piece, self._pop(index))
+        if self.journal is not None:
+            self.journal.append((self._reinsert, (index, piece)))
+        return piece
+
+    def _reinsert(self, index: int, piece: "ChessPiece") -> None:
+        """
+        Undo _release: put piece back at index, moving the piece
+        that took its place back to the end
+        """
+        self.append(piece)
+        self._swap(index, len(self._pieces) - 1)
+
+    def __len__(self) -> int:
+        return len(self._pieces)
+
+    def __iter__(self) -> Iterator["ChessPiece"]:
+        return iter(self._pieces)
+
+    def __contains__(self, piece: object) -> bool:
+        return getattr(piece, "_store", None) is self
+
+    def __repr__(self) -> str:
+        return f"PieceStore({self._pieces!r})"
+
+    @overload
+    def __getitem__(self, index: int) -> "ChessPiece": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list["ChessPiece"]: ...
+
+    def __getitem__(self, index: Union[int, slice]
+                    ) -> Union["ChessPiece", list["ChessPiece"]]:
+        return self._pieces[index]
+
+    @overload
+    def __setitem__(self, index: int, value: "ChessPiece") -> None: ...
+
+    @overload
+    def __setitem__(self, index: slice,
+                    value: Iterable["ChessPiece"]) -> None: ...
+
+    def __setitem__(self, index: Union[int, slice],
+                    value: Union["ChessPiece", Iterable["ChessPiece"]]
+                    ) -> None:
+        """
+        Replace the piece at index in O(1), or a slice in O(n)
+        """
+        if isinstance(index, slice):
+            pieces = list(self._pieces)
+            pieces[index] = cast(Iterable["ChessPiece"], value)
+            self.clear()
+            self.extend(pieces)
+            return
+
+        piece = cast("ChessPiece", value)
+        index = range(len(self._pieces))[index]
+        old = self._pieces[index]
+        if piece is old:
+            return
+        if piece in self:
+            raise ValueError("piece is already in this store")
+
+        if self.journal is not None:
+            self.journal.append((self.__setitem__, (index, old)))
+        values = piece._store._pop(piece._index)
+        PieceRow(old, [column[index] for column in self._columns()])
+        del self._index_of[self._handles[index]]
+        for column, item in zip(self._columns(), values):
+            column[index] = item
+        self._handles[index] = self._new_handle(index)
+        self._pieces[index] = piece
+        piece._store = self
+        piece._index = index
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        """
+        Remove the piece at index, or every piece in a slice
+        """
+        if isinstance(index, slice):
+            for piece in self._pieces[index]:
+                self._release(piece._index)
+        else:
+            self._release(range(len(self._pieces))[index])
+
+    def insert(self, index: int, piece: "ChessPiece") -> None:
+        """
+        Insert piece before index. O(n), unlike append
+        """
+        size = len(self._pieces)
+        index = max(0, min(index + size if index < 0 else index, size))
+        self.append(piece)
+        for slot in range(len(self._pieces) - 1, index, -1):
+            self._swap(slot, slot - 1)
+
+    def _swap(self, first: int, second: int) -> None:
+        for column in self._columns():
+            column[first], column[second] = column[second], column[first]
+        handles, pieces = self._handles, self._pieces
+        handles[first], handles[second] = handles[second], handles[first]
+        pieces[first], pieces[second] = pieces[second], pieces[first]
+        self._index_of[handles[first]] = first
+        self._index_of[handles[second]] = second
+        pieces[first]._index = first
+        pieces[second]._index = second
+
+    def append(self, piece: "ChessPiece") -> None:
+        """
+        Move piece, with its current state, to the end of this store
+        """
+        if piece in self:
+            raise ValueError("piece is already in this store")
+        self._push(piece, piece._store._pop(piece._index))
+        if self.journal is not None:
+            self.journal.append((self.remove, (piece,)))
+
+    def remove(self, piece: "ChessPiece") -> None:
+        """
+        Remove piece in O(1); the last piece takes its index
+        """
+        if piece not in self:
+            raise ValueError("piece is not in this store")
+        self._release(piece._index)
+
+    def index(self, piece: "ChessPiece", start: int = 0,
+              stop: int = 2 ** 31) -> int:
+        """
+        Index of piece in O(1)
+        """
+        if piece not in self or not start <= piece._index < stop:
+            raise ValueError("piece is not in this store")
+        return piece._index
+
+    def clear(self) -> None:
+        """
+        Remove every piece, leaving each with a PieceRow
+        """
+        while self._pieces:
+            self._release(len(self._pieces) - 1)
+
+    def count_kind(self, cls: type["ChessPiece"]) -> int:
+        """
+        Number of pieces of class cls, counted in the kinds array
+        """
+        return self.kinds.count(kind_code(cls))
+
+    def handle(self, piece: "ChessPiece") -> int:
+        """
+        Stable handle of piece, valid until it leaves this store
+        """
+        return self._handles[self.index(piece)]
+
+    def get(self, handle: int) -> "ChessPiece":
+        """
+        Piece with handle; raises KeyError once it has left the store
+        """
+        return self._pieces[self._index_of[handle]]
+
+    def copy(self) -> "PieceStore":
+        """
+        Independent clone of every piece, built by copying the arrays.
+        Cloned pieces do not count towards their class unit_count
+        """
+        clone = PieceStore()
+        for name in COLUMNS:
+            setattr(clone, name, getattr(self, name)[:])
+        clone._handles = self._handles[:]
+        clone._index_of = dict(self._index_of)
+        clone._next_handle = self._next_handle
+        for index, piece in enumerate(self._pieces):
+            view = piece.__class__.__new__(piece.__class__)
+            view.copy_fields(piece)
+            view._store = clone
+            view._index = index
+            clone._pieces.append(view)
+        return clone
@@ -0,0 +1,347 @@
+from typing import Hashable, Optional
+import pygame
+from pygame.font import Font
+from pygame.rect import Rect
+from pygame.surface import Surface
+from assets import AssetManager
+from chess_piece import ChessPiece, NO_TIMER
+from dirty_tracker import DirtyTracker
+from engine import GameEngine
+from text_cache import TextCache
+
+# Layout
+WIDTH, HEIGHT = 640, 700
+ROWS, COLS = 8, 8
+SQUARE_SIZE = WIDTH // COLS
+BOARD_HEIGHT = WIDTH
+SIDEBAR_WIDTH = 125
+THUMBNAIL_SIZE = 30
+LOG_LINES = 3
+LOG_SPACING = 20
+
+# Colors
+WHITE = (245, 245, 245)
+BLACK = (40, 40, 40)
+GRAY = (180, 180, 180)
+DARK_GRAY = (100, 100, 100)
+BLUE = (50, 50, 255)
+RED = (255, 50, 50)
+VICTORY_MIN, VICTORY_MAX = 20, 100  # Range of each victory background channel
+
+
+def timer_alpha(timer: int) -> Optional[int]:
+    """
+    Overlay alpha for an effect timer counting down from 100,
+    or None once it has run out
+    """
+    if timer <= NO_TIMER:
+        return None
+    return max(0, min(255, int(timer / 100 * 255)))
+
+
+class OverlayCache:
+    """
+    Overlay surfaces built once, or once per quantized alpha
+    level for the fading ones, instead of every frame
+    """
+
+    def __init__(self, promotion_overlay: Surface, frozen_overlay: Surface,
+                 levels: int = 32) -> None:
+        """
+        Build the fixed overlays; faded copies are made on first use
+        """
+        self.levels = levels
+        self.highlight = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE),
+                                        pygame.SRCALPHA)  # Opacity
+        self.highlight.fill((0, 255, 0, 100))  # Green color, 100 alpha
+        self.frozen_tint = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE))
+        self.frozen_tint.set_alpha(100)
+        self.frozen_tint.fill((0, 100, 255))
+        self._sources = {"promotion": promotion_overlay,
+                         "frozen": frozen_overlay}
+        self._faded: dict[tuple[str, int], Surface] = {}
+
+    def quantize(self, alpha: int) -> int:
+        """
+        Snap alpha (0-255) to the nearest of the cached levels
+        """
+        step = 255 / (self.levels - 1)
+        return int(round(round(alpha / step) * step))
+
+    def faded(self, name: str, alpha: int) -> Surface:
+        """
+        Copy of overlay name ("promotion" or "frozen") at alpha,
+        shared by every square drawn at the same level
+        """
+        key = (name, self.quantize(alpha))
+        surface = self._faded.get(key)
+        if surface is None:
+            surface = self._sources[name].copy()
+            surface.set_alpha(key[1])
+            self._faded[key] = surface
+        return surface
+
+
+class Renderer:
+    """
+    Draws the game, redrawing only the squares, sidebar and
+    log lines whose content changed since the last frame
+    """
+
+    def __init__(self, screen: Surface, font: Font,
+                 assets: AssetManager,
+                 promotion_overlay: Surface,
+                 frozen_overlay: Surface) -> None:
+        """
+        Initialize the renderer with the window and loaded assets
+        """
+        self.screen = screen
+        self.font = font
+        self.title_font = pygame.font.SysFont('Arial', 50)
+        self.small_font = pygame.font.SysFont('Arial', 24)
+        self.text: TextCache[Surface] = TextCache()
+        self.assets = assets
+        self.overlays = OverlayCache(promotion_overlay, frozen_overlay)
+        self.bg_color = [0.0, 0.0, 20.0]
+        self.bg_drift = [1, 1, 1]  # Color change per 30th of a second
+        self.board_surface = self.build_board_surface()
+
+        self.squares: DirtyTracker[tuple[int, int]] = DirtyTracker()
+        self.sidebar: DirtyTracker[str] = DirtyTracker()
+        self.log: DirtyTracker[int] = DirtyTracker()
+        self._full = True
+
+    def build_board_surface(self) -> Surface:
+        """
+        Paint the checkerboard once; frames blit it instead of
+        drawing 64 rects
+        """
+        surface = pygame.Surface((COLS * SQUARE_SIZE, ROWS * SQUARE_SIZE))
+        surface = surface.convert(self.screen)
+        for row in range(ROWS):
+            for col in range(COLS):
+                color = GRAY if (row + col) % 2 == 0 else DARK_GRAY
+                pygame.draw.rect(surface, color, (col * SQUARE_SIZE,
+                                 row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+        return surface
+
+    def resize(self, screen: Surface) -> None:
+        """
+        Switch to a new window surface, rebuilding the cached board
+        """
+        self.screen = screen
+        self.board_surface = self.build_board_surface()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        Redraw the whole window on the next frame
+        """
+        self._full = True
+        self.squares.invalidate()
+        self.sidebar.invalidate()
+        self.log.invalidate()
+
+    def render(self, engine: GameEngine,
+               highlights: list[tuple[int, int]],
+               elapsed: int = 1000 // 30) -> list[Rect]:
+        """
+        Draw whatever changed and return the dirty rects to pass
+        to pygame.display.update; an empty list means nothing changed.
+        elapsed is the milliseconds since the last frame
+        """
+        if engine.game_over:
+            self.draw_victory_screen(engine.winner, elapsed)
+            self._full = True
+            return [self.screen.get_rect()]
+
+        full = self._full
+        if full:
+            self.invalidate()
+            self._full = False
+            self.screen.fill(BLACK)
+
+        rects = self._render_squares(engine, highlights, full)
+        rects += self._render_sidebar(engine)
+        rects += self._render_log(engine)
+
+        if full:
+            return [self.screen.get_rect()]
+        return rects
+
+    def _render_squares(self, engine: GameEngine,
+                        highlights: list[tuple[int, int]],
+                        full: bool = False) -> list[Rect]:
+        """
+        Redraw every board square whose piece, overlay or
+        highlight changed, or all of them on a full redraw
+        """
+        highlighted = set(highlights)
+        states: dict[tuple[int, int], Hashable] = {}
+        for piece in engine.pieces:
+            square = (piece._row, piece._col)
+            states[square] = self._piece_state(piece, square in highlighted)
+        for square in highlighted:
+            if square not in states:
+                states[square] = (None, True)
+
+        dirty = self.squares.changed(states)
+        if full:
+            # Empty squares come straight from the cached board
+            self.screen.blit(self.board_surface, (0, 0))
+
+        rects = []
+        for square in dirty:
+            row, col = square
+            rects.append(self.draw_square(row, col,
+                                          engine.piece_at(row, col),
+                                          square in highlighted))
+        return rects
+
+    def _piece_state(self, piece: ChessPiece,
+                     highlighted: bool) -> Hashable:
+        """
+        Everything about a piece that affects how its square looks
+        """
+        promotion = None
+        if piece.promoted:
+            promotion = timer_alpha(piece.promotion_timer)
+        frozen = timer_alpha(piece.frozen_timer)
+
+        # Only a change of cached alpha level needs a redraw
+        quantize = self.overlays.quantize
+        return (piece._name, piece._color, highlighted, piece.is_frozen(),
+                None if promotion is None else quantize(promotion),
+                None if frozen is None else quantize(frozen))
+
+    def draw_square(self, row: int, col: int, piece: Optional[ChessPiece],
+                    highlighted: bool) -> Rect:
+        """
+        Draw one square: tile, move highlight, piece and overlays
+        """
+        rect = Rect(col * SQUARE_SIZE, row * SQUARE_SIZE,
+                    SQUARE_SIZE, SQUARE_SIZE)
+        self.screen.blit(self.board_surface, rect, rect)
+
+        # Highlights all valid moves when dragging a piece
+        if highlighted:
+            self.screen.blit(self.overlays.highlight, rect)
+
+        if piece is None:
+            return rect
+
+        image = self.assets.get(piece._name, piece._color, SQUARE_SIZE)
+        if image:
+            self.screen.blit(image, rect)
+
+        # Overlay for Promotion effect
+        if piece.promoted:
+            alpha = timer_alpha(piece.promotion_timer)
+            if alpha is not None:
+                self.screen.blit(self.overlays.faded("promotion", alpha),
+                                 rect)
+
+        if piece.is_frozen():
+            self.screen.blit(self.overlays.frozen_tint, rect)
+
+        # Overlay for Frozen effect
+        alpha = timer_alpha(piece.frozen_timer)
+        if alpha is not None:
+            self.screen.blit(self.overlays.faded("frozen", alpha), rect)
+
+        return rect
+
+    def _render_sidebar(self, engine: GameEngine) -> list[Rect]:
+        """
+        Redraw the captured pieces sidebar if a capture happened
+        """
+        state = (tuple(p.get_name() for p in engine.captured_black),
+                 tuple(p.get_name() for p in engine.captured_white))
+        if not self.sidebar.changed({"captured": state}):
+            return []
+        return [self.draw_captured(engine)]
+
+    def draw_captured(self, engine: GameEngine) -> Rect:
+        """
+        Draws a sidebar displaying all captured pieces during a game
+        """
+        sidebar_x = WIDTH
+        rect = Rect(WIDTH, 0, SIDEBAR_WIDTH, HEIGHT)
+        pygame.draw.rect(self.screen, BLACK, rect)
+
+        # Top half for captured Black pieces, bottom half for White
+        sections = [("White Captured:", engine.captured_black, "Black", 10),
+                    ("Black Captured:", engine.captured_white, "White",
+                     HEIGHT // 2 + 10)]
+        for title, captured, color, y in sections:
+            self.screen.blit(self.text.render(self.font, title, WHITE),
+                             (sidebar_x + 5, y))
+            y += 30
+            for piece in captured:
+                image = self.assets.get(piece.get_name(), color,
+                                        THUMBNAIL_SIZE)
+                if image:
+                    self.screen.blit(image, (sidebar_x + 35, y))
+                    y += 35
+        return rect
+
+    def _render_log(self, engine: GameEngine) -> list[Rect]:
+        """
+        Redraw the log lines whose text changed. Lines overlap a
+        little, so every line is redrawn clipped to the dirty area
+        """
+        lines = engine.event_log.messages(LOG_LINES)
+        dirty = self.log.changed(dict(enumerate(lines)))
+        if not dirty:
+            return []
+
+        height = max(LOG_SPACING, self.font.get_linesize())
+        rects = [Rect(0, BOARD_HEIGHT + 10 + i * LOG_SPACING, WIDTH, height)
+                 for i in sorted(dirty)]
+        area = rects[0].unionall(rects[1:])
+
+        self.screen.set_clip(area)
+        self.screen.fill(BLACK)
+        for i, msg in enumerate(lines):
+            text_surface = self.text.render(self.font, msg, WHITE)
+            self.screen.blit(text_surface,
+                             (10, BOARD_HEIGHT + 10 + i * LOG_SPACING))
+        self.screen.set_clip(None)
+        return [area]
+
+    def draw_victory_screen(self, winner: Optional[str],
+                            elapsed: int = 1000 // 30) -> None:
+        """
+        Screen that appears if game has been won by either side,
+        or drawn when winner is None
+        """
+
+        # Background changes color at the same speed at any frame rate
+        step = elapsed * 30 / 1000
+        for i in range(3):
+            color = self.bg_color[i] + self.bg_drift[i] * step
+
+            # Clamp, so a long frame cannot overshoot the range, and
+            # drift away from whichever bound was reached
+            if color <= VICTORY_MIN:
+                color = VICTORY_MIN
+                self.bg_drift[i] = abs(self.bg_drift[i])
+            elif color >= VICTORY_MAX:
+                color = VICTORY_MAX
+                self.bg_drift[i] = -abs(self.bg_drift[i])
+            self.bg_color[i] = color
+
+        self.screen.fill([int(c) for c in self.bg_color])
+
+        title = "DRAW!" if winner is None else f"{winner} WINS!"
+        text = self.text.render(self.title_font, title,
+                                (255, 255, 0))
+        text_rect = text.get_rect(center=((WIDTH + SIDEBAR_WIDTH) // 2,
+                                          HEIGHT // 2))
+        self.screen.blit(text, text_rect)
+
+        subtext = self.text.render(self.small_font, "Click to exit",
+                                   (200, 200, 200))
+        subtext_rect = subtext.get_rect(center=((WIDTH + SIDEBAR_WIDTH) // 2,
+                                                HEIGHT // 2 + 50))
+        self.screen.blit(subtext, subtext_rect)
@@ -0,0 +1,158 @@
+"""
+Batch self-play for tuning Chess Party event settings.
+
+Seeded games are spread across worker processes; each worker keeps one
+GameEngine and resets it between games, and sends back one
+SelfPlayStats per batch of games. Example:
+
+    python3 selfplay.py --games 10000 --workers 4 --event-chance 0.3
+"""
+
+import argparse
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional
+from engine import GameEngine
+
+_engine: Optional[GameEngine] = None
+
+
+class SelfPlayStats:
+    """
+    Aggregated results of a number of self-play games
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize empty totals
+        """
+        self.games = 0
+        self.results: dict[str, int] = {"White": 0, "Black": 0, "Draw": 0}
+        self.total_plies = 0
+        self.longest = 0
+        self.captures = 0
+        self.event_counts: dict[str, int] = {}
+
+    def add_game(self, engine: GameEngine) -> None:
+        """
+        Record the finished game held by engine
+        """
+        self.games += 1
+        self.results[engine.winner or "Draw"] += 1
+        self.total_plies += engine.turn_count
+        self.longest = max(self.longest, engine.turn_count)
+        self.captures += (len(engine.captured_white)
+                          + len(engine.captured_black))
+        for name, count in engine.event_counts.items():
+            self.event_counts[name] = self.event_counts.get(name, 0) + count
+
+    def merge(self, other: "SelfPlayStats") -> None:
+        """
+        Add the totals of other into these totals
+        """
+        self.games += other.games
+        for result, count in other.results.items():
+            self.results[result] += count
+        self.total_plies += other.total_plies
+        self.longest = max(self.longest, other.longest)
+        self.captures += other.captures
+        for name, count in other.event_counts.items():
+            self.event_counts[name] = self.event_counts.get(name, 0) + count
+
+    def report(self, elapsed: float) -> str:
+        """
+        Human readable summary; elapsed is the wall time in seconds
+        """
+        games = max(self.games, 1)
+        lines = [f"games:        {self.games}"]
+        for result, count in self.results.items():
+            lines.append(f"{result + ':':<13} {count / games:.1%}")
+        lines.append(f"avg plies:    {self.total_plies / games:.1f}"
+                     f" (max {self.longest})")
+        lines.append(f"avg captures: {self.captures / games:.2f}")
+        for name, count in sorted(self.event_counts.items()):
+            lines.append(f"{name}: {count / games:.2f} per game")
+        lines.append(f"throughput:   {self.games / max(elapsed, 1e-9):.0f}"
+                     f" games/sec")
+        return "\n".join(lines)
+
+
+def play_game(engine: GameEngine, seed: int, max_plies: int) -> None:
+    """
+    Play one game of random moves from a fresh position.
+    The game is a draw if it hits max_plies or the side to move
+    has no valid move (every piece frozen or blocked)
+    """
+    engine.reset(seed)
+    while not engine.game_over and engine.turn_count < max_plies:
+        moves = engine.available_moves()
+        if not moves:
+            break
+        engine.step(engine.rng.choice(moves))
+
+
+def init_worker(event_chance: float, queen_limit: int) -> None:
+    """
+    Create the engine reused by every game in this worker
+    """
+    global _engine
+    _engine = GameEngine(event_chance=event_chance, queen_limit=queen_limit)
+
+
+def play_batch(seeds: range, max_plies: int) -> SelfPlayStats:
+    """
+    Play one game per seed on the worker engine
+    """
+    if _engine is None:
+        raise RuntimeError("init_worker must run before play_batch")
+    stats = SelfPlayStats()
+    for seed in seeds:
+        play_game(_engine, seed, max_plies)
+        stats.add_game(_engine)
+    return stats
+
+
+def run(games: int, workers: Optional[int] = None, batch_size: int = 50,
+        seed: int = 0, event_chance: float = 0.5, queen_limit: int = 4,
+        max_plies: int = 300) -> SelfPlayStats:
+    """
+    Play games seeded seed .. seed + games - 1 across worker
+    processes and merge the batches as they come back
+    """
+    total = SelfPlayStats()
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                             initargs=(event_chance, queen_limit)) as pool:
+        futures = [
+            pool.submit(play_batch,
+                        range(start, min(start + batch_size, seed + games)),
+                        max_plies)
+            for start in range(seed, seed + games, batch_size)
+        ]
+        for future in as_completed(futures):
+            total.merge(future.result())
+    return total
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """
+    Command line entry point
+    """
+    parser = argparse.ArgumentParser(description="Chess Party self-play")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--event-chance", type=float, default=0.5)
+    parser.add_argument("--queen-limit", type=int, default=4)
+    parser.add_argument("--max-plies", type=int, default=300)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = run(args.games, args.workers, args.batch_size, args.seed,
+                args.event_chance, args.queen_limit, args.max_plies)
+    print(stats.report(time.perf_counter() - start))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Shared helpers for the unittests
+
+"""
+
+import unittest
+from chess_piece import ChessPiece, Pawn, Rook, Knight
+from chess_piece import Bishop, King, Queen
+
+PIECE_CLASSES: list[type[ChessPiece]] = [Pawn, Rook, Knight,
+                                         Bishop, King, Queen]
+
+
+class PieceCountTestCase(unittest.TestCase):
+    """
+    TestCase that restores every class unit_count afterwards,
+    so creating pieces does not leak into test_unit_count
+    """
+
+    def setUp(self) -> None:
+        """
+        Remember unit counts
+        """
+        self._unit_counts = {cls: cls.unit_count for cls in PIECE_CLASSES}
+
+    def tearDown(self) -> None:
+        """
+        Restore unit counts
+        """
+        for cls, count in self._unit_counts.items():
+            cls.unit_count = count
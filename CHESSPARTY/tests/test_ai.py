@@ -0,0 +1,110 @@
+"""
+Unittest for AIPlayer class found in ai.py
+
+"""
+
+import time
+import unittest
+from ai import AIPlayer, MATE, evaluate
+from chess_piece import ChessPiece, King, Pawn, Queen, Rook
+from engine import GameEngine
+from tests.helpers import PieceCountTestCase
+
+
+class TestAIPlayer(PieceCountTestCase):
+    """
+    TestAIPlayer class to test AIPlayer class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate GameEngine object
+        """
+        super().setUp()
+        self.engine = GameEngine(seed=1, event_chance=0.0)
+
+    def load(self, pieces: list[ChessPiece]) -> None:
+        """
+        Put pieces on the engine board, White to move
+        """
+        self.engine.pieces[:] = pieces
+        self.engine.board.update(self.engine.pieces)
+
+    def test_finds_mate_in_one(self) -> None:
+        """
+        Test a back rank mate is found and scored as mate
+        """
+        pieces: list[ChessPiece] = [
+            King("King", "White", 0, 4, 1, 1, "any"),
+            Rook("Rook", "White", 0, 0, 2, 8, "line"),
+            King("King", "Black", 7, 6, 1, 1, "any")]
+        pieces += [Pawn("Pawn", "Black", 6, col, 8, 1, "forward")
+                   for col in (5, 6, 7)]
+        self.load(pieces)
+
+        result = AIPlayer(time_budget=5.0).search(self.engine)
+        self.assertEqual(result.move, ((0, 0), (7, 0)))
+        self.assertEqual(result.score, MATE - 1)
+
+    def test_mate_distance_through_table(self) -> None:
+        """
+        Test a mate in one found first keeps its distance when the
+        position comes back two plies deeper: the root is a mate in 2
+        """
+        self.load([King("King", "White", 0, 4, 1, 1, "any"),
+                   Rook("Rook", "White", 5, 0, 2, 8, "line"),
+                   Rook("Rook", "White", 0, 1, 2, 8, "line"),
+                   King("King", "Black", 6, 7, 1, 1, "any")])
+        ai = AIPlayer(time_budget=5.0)
+        self.engine.make_move(((0, 1), (6, 1)))
+        for escape in ((7, 6), (7, 7)):
+            self.engine.make_move(((6, 7), escape))
+            self.assertEqual(ai.search(self.engine).score, MATE - 1)
+            self.engine.unmake_move()
+        self.engine.unmake_move()
+
+        result = ai.search(self.engine)
+        self.assertEqual(result.move, ((0, 1), (6, 1)))
+        self.assertEqual(result.score, MATE - 3)
+        self.assertEqual(result.depth, 3)
+
+    def test_takes_hanging_queen(self) -> None:
+        """
+        Test the search wins material and leaves the engine as it was
+        """
+        self.load([King("King", "White", 0, 4, 1, 1, "any"),
+                   Rook("Rook", "White", 3, 0, 2, 8, "line"),
+                   Queen("Queen", "Black", 3, 6, 1, 8, "any"),
+                   King("King", "Black", 7, 4, 1, 1, "any")])
+        start = self.engine.board.zobrist_hash
+
+        result = AIPlayer(time_budget=5.0, max_depth=2).search(self.engine)
+        self.assertEqual(result.move, ((3, 0), (3, 6)))
+        self.assertEqual(result.depth, 2)
+        self.assertGreater(result.score, 0)
+        self.assertEqual(self.engine.board.zobrist_hash, start)
+        self.assertEqual(self.engine.undo_stack, [])
+
+    def test_time_budget(self) -> None:
+        """
+        Test a search stops on time with the last finished depth
+        """
+        ai = AIPlayer(time_budget=0.05)
+        started = time.perf_counter()
+        result = ai.search(self.engine)
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertIn(result.move, self.engine.available_moves())
+        self.assertGreaterEqual(result.depth, 1)
+        self.assertGreater(len(ai.table), 0)
+
+    def test_evaluate_is_symmetric(self) -> None:
+        """
+        Test the start position is level for both sides
+        """
+        self.assertEqual(evaluate(self.engine), 0)
+        self.engine.current_turn = "Black"
+        self.assertEqual(evaluate(self.engine), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,77 @@
+"""
+Unittest for AIWorker class found in ai_worker.py
+
+"""
+
+import time
+import unittest
+from ai_worker import AIWorker
+from engine import GameEngine
+from tests.helpers import PieceCountTestCase
+
+
+class TestAIWorker(PieceCountTestCase):
+    """
+    TestAIWorker class to test AIWorker class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Start a worker with a short time budget
+        """
+        super().setUp()
+        self.worker = AIWorker(time_budget=0.1)
+        self.engine = GameEngine(seed=1, event_chance=0.0)
+
+    def tearDown(self) -> None:
+        """
+        Shut the worker down
+        """
+        self.worker.close()
+        super().tearDown()
+
+    def wait(self, timeout: float = 5.0) -> None:
+        """
+        Poll like the game loop until the request is answered
+        """
+        deadline = time.perf_counter() + timeout
+        while not self.worker.done and time.perf_counter() < deadline:
+            self.worker.poll()
+            time.sleep(0.005)
+
+    def test_request_and_poll(self) -> None:
+        """
+        Test a request streams moves and ends with a legal answer
+        """
+        self.assertIsNone(self.worker.poll())
+        self.worker.request(self.engine)
+        self.assertTrue(self.worker.pending)
+        self.wait()
+        self.assertTrue(self.worker.done)
+        self.assertFalse(self.worker.pending)
+        best = self.worker.best
+        assert best is not None
+        self.assertIn(best.move, self.engine.available_moves())
+        self.assertGreaterEqual(best.depth, 1)
+
+    def test_cancel_drops_results(self) -> None:
+        """
+        Test a cancelled request never reports, and the next one does
+        """
+        first = self.worker.request(self.engine)
+        self.worker.cancel()
+        self.assertFalse(self.worker.pending)
+        time.sleep(0.2)
+        self.assertIsNone(self.worker.poll())
+        self.assertIsNone(self.worker.best)
+
+        self.engine.step(((1, 4), (3, 4)))
+        self.assertEqual(self.worker.request(self.engine), first + 1)
+        self.wait()
+        best = self.worker.best
+        assert best is not None
+        self.assertIn(best.move, self.engine.available_moves())
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
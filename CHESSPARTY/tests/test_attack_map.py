@@ -0,0 +1,100 @@
+"""
+Unittest for AttackMap class found in attack_map.py
+
+"""
+
+import unittest
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists, tuples
+from board import Board
+from chess_piece import ChessPiece, Bishop, King, Knight, Pawn, Queen, Rook
+from engine import starting_pieces
+from tests.helpers import PieceCountTestCase
+
+
+class TestAttackMap(PieceCountTestCase):
+    """
+    TestAttackMap class to test AttackMap class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate a Board in the starting position
+        """
+        super().setUp()
+        self.pieces = starting_pieces()
+        self.board = Board(self.pieces)
+        self.attacks = self.board.attacks
+
+    def test_starting_attacks(self) -> None:
+        """
+        Test pawns, Knights and guarded pieces in the start position
+        """
+        self.assertTrue(self.attacks.is_attacked((2, 4), "White"))
+        self.assertFalse(self.attacks.is_attacked((3, 4), "White"))
+        self.assertTrue(self.attacks.is_attacked((6, 0), "Black"))
+        self.assertCountEqual(self.attacks.attackers_of((2, 2)),
+                              [self.board.grid[1][1], self.board.grid[1][3],
+                               self.board.grid[0][1]])
+        self.assertEqual(len(self.attacks.attacked("White")), 22)
+
+    def test_larger_board(self) -> None:
+        """
+        Test Kings and Knights past the 8x8 jump tables on a larger Board
+        """
+        king = King("King", "White", 9, 9, 1, 1, "line")
+        knight = Knight("Knight", "Black", 8, 9, 1, 1, "line")
+        board = Board([king, knight], 12, 12)
+        self.assertEqual(king.get_attacks(board), [])
+        self.assertEqual(knight.get_attacks(board), [(7, 7)])
+        self.assertTrue(board.attacks.is_attacked((7, 7), "Black"))
+        self.assertFalse(board.attacks.is_attacked((7, 7), "White"))
+
+    def test_sliders_follow_moves(self) -> None:
+        """
+        Test a slider's attacks grow when a blocker leaves its ray
+        """
+        self.assertFalse(self.attacks.is_attacked((4, 7), "White"))
+        pawn = self.board.grid[1][4]
+        assert pawn is not None
+        self.board.move_piece(pawn, 3, 4)
+        # The Bishop on (0, 5) now sees all the way to (5, 0)
+        self.assertTrue(self.attacks.is_attacked((4, 1), "White"))
+        self.assertTrue(self.attacks.is_attacked((5, 0), "White"))
+        self.board.move_piece(pawn, 2, 3)
+        self.assertFalse(self.attacks.is_attacked((5, 0), "White"))
+
+    @settings(max_examples=50)
+    @given(lists(tuples(integers(min_value=0, max_value=5),
+                        integers(min_value=0, max_value=7),
+                        integers(min_value=0, max_value=7)), max_size=20))
+    def test_incremental_matches_rebuild(
+            self, moves: list[tuple[int, int, int]]) -> None:
+        """
+        Test the incremental maps equal maps built from scratch after
+        hypothesis generated moves and captures
+        """
+        pieces: list[ChessPiece] = [
+            Rook("Rook", "White", 0, 0, 2, 8, "line"),
+            Bishop("Bishop", "Black", 2, 2, 2, 8, "diagonal"),
+            Queen("Queen", "White", 3, 3, 1, 8, "any"),
+            Knight("Knight", "Black", 4, 1, 2, 5, "L"),
+            Pawn("Pawn", "White", 1, 6, 8, 1, "forward"),
+            King("King", "Black", 7, 4, 1, 1, "any")]
+        board = Board(pieces)
+        for index, row, col in moves:
+            board.move_piece(pieces[index], row, col)
+        on_board = [piece for row_pieces in board.grid
+                    for piece in row_pieces if piece is not None]
+        fresh = Board(on_board).attacks
+
+        self.assertEqual(
+            {piece: sorted(t) for piece, t in board.attacks.targets.items()},
+            {piece: sorted(t) for piece, t in fresh.targets.items()})
+        for color in ("White", "Black"):
+            self.assertEqual(board.attacks.counts.get(color, {}),
+                             fresh.counts.get(color, {}))
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
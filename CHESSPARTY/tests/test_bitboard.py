@@ -0,0 +1,96 @@
+"""
+Unittest for BitBoard class found in bitboard.py
+
+"""
+
+import unittest
+from hypothesis import given
+from hypothesis import strategies as st
+from board import Board
+from bitboard import BitBoard, mask_to_moves
+from chess_piece import ChessPiece, Pawn, Rook
+from tests.helpers import PIECE_CLASSES, PieceCountTestCase
+
+
+class TestBitBoard(PieceCountTestCase):
+    """
+    TestBitBoard class to test BitBoard class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate BitBoard object
+        """
+        super().setUp()
+        self.rook = Rook("Rook", "White", 0, 0, 2, 8, "line")
+        self.pawn = Pawn("Pawn", "Black", 6, 3, 8, 1, "forward")
+        self.board = BitBoard([self.rook, self.pawn])
+
+    def test_occupancy_masks(self) -> None:
+        """
+        Test occupancy per color and per piece type
+        """
+        self.assertEqual(self.board.own_mask("White"), 1)
+        self.assertEqual(self.board.own_mask("Black"), 1 << 51)
+        self.assertEqual(self.board.get_pieces_mask("Pawn", "Black"),
+                         1 << 51)
+        self.assertEqual(self.board.occupied, 1 | 1 << 51)
+
+    def test_move_piece_updates_masks(self) -> None:
+        """
+        Test moving and capturing keep bitboards in sync
+        """
+        self.board.move_piece(self.rook, 6, 0)
+        self.assertEqual(self.board.own_mask("White"), 1 << 48)
+        captured = self.board.move_piece(self.rook, 6, 3)
+        self.assertEqual(captured, self.pawn)
+        self.assertEqual(self.board.own_mask("Black"), 0)
+        self.assertEqual(self.board.occupied, 1 << 51)
+        self.assertTrue(self.board.is_empty(6, 0))
+        self.assertFalse(self.board.is_empty(6, 3))
+
+    def test_remove_piece_updates_masks(self) -> None:
+        """
+        Test remove piece clears the bitboards
+        """
+        self.board.remove_piece(self.pawn)
+        self.assertEqual(self.board.get_pieces_mask("Pawn", "Black"), 0)
+        self.assertEqual(self.board.occupied, 1)
+
+    def test_rejects_non_standard_size(self) -> None:
+        """
+        Test BitBoard only accepts 8x8 boards
+        """
+        with self.assertRaises(ValueError):
+            BitBoard([], 10, 10)
+
+    def test_mask_to_moves(self) -> None:
+        """
+        Test conversion from bitboard to (row, col) list
+        """
+        self.assertEqual(mask_to_moves(1 | 1 << 9 | 1 << 63),
+                         [(0, 0), (1, 1), (7, 7)])
+
+    @given(st.lists(st.tuples(st.integers(0, 5), st.booleans(),
+                              st.integers(0, 63)),
+                    min_size=1, max_size=20, unique_by=lambda t: t[2]))
+    def test_moves_match_grid_board(
+            self, layout: list[tuple[int, bool, int]]) -> None:
+        """
+        Test bitboard move generation matches the grid version
+        for randomly generated positions
+        """
+        pieces: list[ChessPiece] = [
+            PIECE_CLASSES[kind]("Test", "White" if white else "Black",
+                                sq // 8, sq % 8, 1, 1, "any")
+            for kind, white, sq in layout
+        ]
+        grid_board = Board(pieces)
+        bit_board = BitBoard(pieces)
+        for piece in pieces:
+            self.assertEqual(sorted(piece.get_valid_moves(grid_board)),
+                             sorted(piece.get_valid_moves(bit_board)))
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -5,9 +5,10 @@ Unittest for Board class found in board.py
 
 import unittest
 from hypothesis import given
-from hypothesis.strategies import integers
+from hypothesis.strategies import integers, lists, tuples
 from board import Board
-from chess_piece import ChessPiece
+from chess_piece import ChessPiece, King, Pawn, Queen, Rook
+from tests.helpers import PieceCountTestCase
 
 
 class MockPiece(ChessPiece):
@@ -128,6 +129,192 @@ class TestBoard(unittest.TestCase):
         piece = self.board.get_piece(row, col)
         self.assertEqual(is_empty, piece is None)
 
+    def test_move_piece_updates_grid(self) -> None:
+        """
+        Test move piece clears old square and fills new one
+        """
+        captured = self.board.move_piece(self.piece1, 5, 5)
+        self.assertIsNone(captured)
+        self.assertTrue(self.board.is_empty(1, 1))
+        self.assertEqual(self.board.get_piece(5, 5), self.piece1)
+        self.assertEqual((self.piece1._row, self.piece1._col), (5, 5))
+        tile = self.board.get_tile(1, 1)
+        assert tile is not None
+        self.assertFalse(tile.is_piece_in_place())
+
+    def test_move_piece_returns_capture(self) -> None:
+        """
+        Test move piece returns the piece on the target square
+        """
+        captured = self.board.move_piece(self.piece1, 3, 4)
+        self.assertEqual(captured, self.piece3)
+        self.assertEqual(self.board.get_piece(3, 4), self.piece1)
+
+    def test_remove_and_place_piece(self) -> None:
+        """
+        Test remove piece and place piece keep board state in sync
+        """
+        self.board.remove_piece(self.piece2)
+        self.assertTrue(self.board.is_empty(2, 1))
+        tile = self.board.get_tile(2, 1)
+        assert tile is not None
+        self.assertFalse(tile.is_piece_in_place())
+
+        self.assertIsNone(self.board.place_piece(self.piece2))
+        self.assertEqual(self.board.get_piece(2, 1), self.piece2)
+        self.assertTrue(tile.is_piece_in_place())
+
+    def test_pieces_by_color(self) -> None:
+        """
+        Test the color index follows moves, captures and replacements
+        """
+        self.assertEqual(self.board.pieces_of("White"),
+                         [self.piece1, self.piece2])
+        self.board.move_piece(self.piece1, 3, 4)
+        self.assertEqual(self.board.pieces_of("Black"), [])
+        self.assertEqual(len(self.board.pieces_of("White")), 2)
+
+        replacement = MockPiece("Test", "Black", 2, 1, 1, 1, "line")
+        self.assertEqual(self.board.place_piece(replacement), self.piece2)
+        self.assertEqual(self.board.pieces_of("White"), [self.piece1])
+        self.assertEqual(self.board.pieces_of("Black"), [replacement])
+        self.board.remove_piece(replacement)
+        self.assertEqual(self.board.pieces_of("Black"), [])
+        self.assertEqual(self.board.pieces_of("Green"), [])
+
+    def test_hash_restored_after_move_back(self) -> None:
+        """
+        Test position hash returns to its value when a move is undone
+        """
+        start = self.board.zobrist_hash
+        self.board.move_piece(self.piece1, 5, 5)
+        self.assertNotEqual(self.board.zobrist_hash, start)
+        self.board.move_piece(self.piece1, 1, 1)
+        self.assertEqual(self.board.zobrist_hash, start)
+
+    def test_freeze_changes_hash(self) -> None:
+        """
+        Test freezing and thawing a piece updates the position hash
+        """
+        start = self.board.zobrist_hash
+        self.board.freeze_piece(self.piece1, 2)
+        frozen_twice = self.board.zobrist_hash
+        self.assertNotEqual(frozen_twice, start)
+        self.assertEqual(frozen_twice, self.board.compute_hash())
+
+        self.board.reduce_frozen(self.piece1)
+        self.assertNotEqual(self.board.zobrist_hash, frozen_twice)
+        self.board.reduce_frozen(self.piece1)
+        self.assertEqual(self.board.zobrist_hash, start)
+
+    @given(lists(tuples(integers(min_value=0, max_value=2),
+                        integers(min_value=0, max_value=7),
+                        integers(min_value=0, max_value=7)), max_size=20))
+    def test_incremental_hash_matches_full_hash(
+            self, moves: list[tuple[int, int, int]]) -> None:
+        """
+        Test incremental hash equals a full recompute after
+        hypothesis generated moves and captures
+        """
+        pieces: list[ChessPiece] = [
+            MockPiece("Test", "White", 1, 1, 1, 1, "line"),
+            MockPiece("Test", "White", 2, 1, 1, 1, "line"),
+            MockPiece("Test", "Black", 3, 4, 1, 1, "line")]
+        board = Board(pieces)
+        for index, row, col in moves:
+            board.move_piece(pieces[index], row, col)
+            self.assertEqual(board.zobrist_hash, board.compute_hash())
+
+    def test_valid_moves_cached(self) -> None:
+        """
+        Test board move cache hits for an unchanged position
+        and misses once the position changes
+        """
+        moves = self.board.get_valid_moves(self.piece3)
+        self.assertEqual(self.board.get_valid_moves(self.piece3), moves)
+        self.assertEqual(self.board.move_cache.hits, 1)
+
+        self.board.move_piece(self.piece2, 4, 4)
+        self.assertEqual(self.board.get_valid_moves(self.piece3), [(4, 4)])
+        self.assertEqual(self.board.move_cache.misses, 2)
+
+
+class TestLegalMoves(PieceCountTestCase):
+    """
+    TestLegalMoves class to test check detection and legal moves
+    """
+
+    def test_pinned_piece_stays_on_line(self) -> None:
+        """
+        Test a pinned Rook may only move along the pin
+        """
+        rook = Rook("Rook", "White", 1, 4, 2, 8, "line")
+        board = Board([King("King", "White", 0, 4, 1, 1, "any"), rook,
+                       Rook("Rook", "Black", 7, 4, 2, 8, "line")])
+        self.assertEqual(sorted(board.legal_targets(rook)),
+                         [(row, 4) for row in range(2, 8)])
+        self.assertGreater(len(board.get_valid_moves(rook)), 6)
+
+    def test_check_must_be_answered(self) -> None:
+        """
+        Test only blocking moves and safe King steps answer a check
+        """
+        king = King("King", "White", 0, 4, 1, 1, "any")
+        rook = Rook("Rook", "White", 3, 0, 2, 8, "line")
+        board = Board([king, rook,
+                       Rook("Rook", "Black", 5, 4, 2, 8, "line")])
+        self.assertTrue(board.in_check("White"))
+        self.assertFalse(board.in_check("Black"))
+        self.assertEqual(board.legal_targets(rook), [(3, 4)])
+        self.assertCountEqual(board.legal_targets(king),
+                              [(0, 3), (0, 5), (1, 3), (1, 5)])
+
+    def test_king_cannot_step_back_along_check(self) -> None:
+        """
+        Test the square behind the King on a checking ray is unsafe
+        """
+        king = King("King", "White", 3, 4, 1, 1, "any")
+        board = Board([king, Rook("Rook", "Black", 7, 4, 2, 8, "line")])
+        targets = board.legal_targets(king)
+        self.assertNotIn((2, 4), targets)
+        self.assertNotIn((4, 4), targets)
+        self.assertEqual(len(targets), 6)
+
+    def test_checkmate(self) -> None:
+        """
+        Test a back rank mate
+        """
+        pieces: list[ChessPiece] = [King("King", "White", 0, 6, 1, 1, "any"),
+                                    Rook("Rook", "Black", 0, 0, 2, 8, "line")]
+        pieces += [Pawn("Pawn", "White", 1, col, 8, 1, "forward")
+                   for col in (5, 6, 7)]
+        board = Board(pieces)
+        self.assertTrue(board.is_checkmate("White"))
+        self.assertFalse(board.is_stalemate("White"))
+        self.assertEqual(board.legal_moves("White"), [])
+
+    def test_stalemate(self) -> None:
+        """
+        Test a King with no safe square and no check is stalemated
+        """
+        board = Board([King("King", "White", 0, 0, 1, 1, "any"),
+                       Queen("Queen", "Black", 2, 1, 1, 8, "any"),
+                       King("King", "Black", 7, 7, 1, 1, "any")])
+        self.assertTrue(board.is_stalemate("White"))
+        self.assertFalse(board.is_checkmate("White"))
+        self.assertFalse(board.is_stalemate("Black"))
+
+    def test_without_king_every_move_is_legal(self) -> None:
+        """
+        Test legal moves equal valid moves once the King is gone
+        """
+        rook = Rook("Rook", "White", 1, 4, 2, 8, "line")
+        board = Board([rook, Rook("Rook", "Black", 7, 4, 2, 8, "line")])
+        self.assertFalse(board.in_check("White"))
+        self.assertEqual(board.legal_targets(rook),
+                         board.get_valid_moves(rook))
+        self.assertEqual(len(board.legal_moves("White")), 14)
+
 
 if __name__ == "__main__":
     unittest.main()  # pragma: no cover
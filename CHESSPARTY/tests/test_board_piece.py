@@ -48,6 +48,12 @@ class TestBoardPiece(unittest.TestCase):
         self.obj.set_piece_in_place(pip)
         self.assertEqual(self.obj.is_piece_in_place(), True)
 
+    def test_no_instance_dict(self) -> None:
+        """ Test BoardPiece is slotted and rejects new attributes"""
+        self.assertFalse(hasattr(self.obj, "__dict__"))
+        with self.assertRaises(AttributeError):
+            setattr(self.obj, "shade", "dark")
+
 
 if __name__ == "__main__":
     unittest.main()  # pragma: no cover
@@ -6,10 +6,12 @@ that adheres to the Chess rules are allowed, as intended
 """
 
 import unittest
+from board import Board
 from hypothesis import given
 from hypothesis import strategies as st
 from chess_piece import Pawn, Rook, Knight
-from chess_piece import Bishop, King, Queen
+from chess_piece import Bishop, King, Queen, NO_TIMER
+from tests.helpers import PIECE_CLASSES, PieceCountTestCase
 
 
 class TestChessPiece(unittest.TestCase):
@@ -89,5 +91,53 @@ class TestChessPiece(unittest.TestCase):
         self.assertEqual(4, self.queen.get_unit_count())
 
 
+class TestPieceLayout(PieceCountTestCase):
+    """
+    TestPieceLayout class to test the slotted ChessPiece layout
+    """
+
+    def test_no_instance_dict(self) -> None:
+        """
+        Test every piece class is slotted and rejects new attributes
+        """
+        for cls in PIECE_CLASSES:
+            piece = cls("Test", "White", 0, 0, 1, 1, "line")
+            self.assertFalse(hasattr(piece, "__dict__"))
+            with self.assertRaises(AttributeError):
+                setattr(piece, "speed", 1)
+
+    def test_timers_start_unset(self) -> None:
+        """
+        Test effect timers start at the NO_TIMER sentinel
+        """
+        piece = Rook("Test", "White", 0, 0, 1, 1, "line")
+        self.assertEqual(piece.promotion_timer, NO_TIMER)
+        self.assertEqual(piece.frozen_timer, NO_TIMER)
+        self.assertFalse(piece.promoted or piece.frozen)
+
+
+class TestOffTableMoves(PieceCountTestCase):
+    """
+    TestOffTableMoves class to test pieces outside the 8x8 move tables
+    """
+
+    def test_larger_board(self) -> None:
+        """
+        Test pieces past row or column 7 of a larger Board walk their
+        moves instead of indexing the tables
+        """
+        rook = Rook("Test", "White", 8, 2, 1, 1, "line")
+        queen = Queen("Test", "Black", 9, 9, 1, 1, "line")
+        board = Board([rook, queen], 12, 12)
+        self.assertEqual(rook.get_valid_moves(board),
+                         [(row, 2) for row in range(7, -1, -1)])
+        self.assertEqual(queen.get_valid_moves(board), [])
+
+        knight = Knight("Test", "White", 9, 8, 1, 1, "line")
+        king = King("Test", "Black", 8, 8, 1, 1, "line")
+        self.assertEqual(knight.get_valid_moves(board), [(7, 7)])
+        self.assertEqual(king.get_valid_moves(board), [(7, 7)])
+
+
 if __name__ == "__main__":
     unittest.main()  # pragma: no cover
@@ -0,0 +1,54 @@
+"""
+Unittest for DirtyTracker class found in dirty_tracker.py
+
+"""
+
+import unittest
+from typing import Hashable
+from dirty_tracker import DirtyTracker
+
+
+class TestDirtyTracker(unittest.TestCase):
+    """
+    TestDirtyTracker class to test DirtyTracker class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate DirtyTracker object
+        """
+        self.tracker: DirtyTracker[str] = DirtyTracker()
+
+    def test_first_call_reports_everything(self) -> None:
+        """
+        Test nothing has been drawn before the first frame
+        """
+        self.assertEqual(self.tracker.changed({"a": 1, "b": 2}), {"a", "b"})
+
+    def test_unchanged_regions_are_clean(self) -> None:
+        """
+        Test a repeated state reports nothing
+        """
+        self.tracker.changed({"a": 1, "b": 2})
+        self.assertEqual(self.tracker.changed({"a": 1, "b": 2}), set())
+
+    def test_changed_added_and_removed_regions(self) -> None:
+        """
+        Test changed, new and vanished regions are all dirty
+        """
+        self.tracker.changed({"a": 1, "b": 2})
+        current: dict[str, Hashable] = {"a": 5, "c": 3}
+        self.assertEqual(self.tracker.changed(current), {"a", "b", "c"})
+
+    def test_invalidate(self) -> None:
+        """
+        Test invalidate reports every known region once
+        """
+        self.tracker.changed({"a": 1})
+        self.tracker.invalidate()
+        self.assertEqual(self.tracker.changed({"b": 1}), {"a", "b"})
+        self.assertEqual(self.tracker.changed({"b": 1}), set())
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,89 @@
+"""
+Unittest for EffectSystem class found in effects.py
+
+"""
+
+import unittest
+from chess_piece import NO_TIMER, Rook
+from effects import Effect, EffectSystem, FROZEN, FULL_TIMER, PROMOTION
+from tests.helpers import PieceCountTestCase
+
+
+class TestEffectSystem(PieceCountTestCase):
+    """
+    TestEffectSystem class to test EffectSystem class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate EffectSystem and Rook objects
+        """
+        super().setUp()
+        self.effects = EffectSystem()
+        self.rook = Rook("Rook", "White", 0, 0, 2, 8, "line")
+        self.other = Rook("Rook", "Black", 7, 7, 2, 8, "line")
+
+    def test_start_sets_piece_fields(self) -> None:
+        """
+        Test starting an effect turns its flag and timer on
+        """
+        self.effects.start(self.rook, PROMOTION, 10)
+        self.assertTrue(self.rook.promoted)
+        self.assertEqual(self.rook.promotion_timer, FULL_TIMER)
+        self.assertFalse(self.rook.frozen)
+        self.assertEqual(len(self.effects), 1)
+
+    def test_tick_counts_down_and_expires(self) -> None:
+        """
+        Test ticks update the piece timers and expire in bulk
+        """
+        expired: list[list[Effect]] = []
+        self.effects.on_expire(expired.append)
+        self.effects.start(self.rook, FROZEN, 300)
+        self.effects.start(self.other, FROZEN, 200)
+        self.effects.start(self.other, PROMOTION, 500)
+
+        self.assertEqual(self.effects.tick(150), [])
+        self.assertEqual(self.rook.frozen_timer, 50)
+        self.assertEqual(self.other.frozen_timer, 25)
+        done = self.effects.tick(200)
+        self.assertCountEqual(done, [(self.rook, FROZEN),
+                                     (self.other, FROZEN)])
+        self.assertEqual(expired, [done])
+        self.assertFalse(self.rook.frozen or self.other.frozen)
+        self.assertEqual(self.rook.frozen_timer, NO_TIMER)
+        self.assertEqual(self.other.promotion_timer, 30)
+        self.assertEqual(len(self.effects), 1)
+
+    def test_restart_resets_timer(self) -> None:
+        """
+        Test starting a running effect again does not duplicate it
+        """
+        self.effects.start(self.rook, FROZEN, 100)
+        self.effects.tick(50)
+        self.effects.start(self.rook, FROZEN, 100)
+        self.effects.tick(10)
+        self.assertEqual(len(self.effects), 1)
+        self.assertEqual(self.rook.frozen_timer, 90)
+
+    def test_timer_rounds_up(self) -> None:
+        """
+        Test a piece timer only reaches zero when the effect ends
+        """
+        self.effects.start(self.rook, FROZEN, 1000)
+        self.effects.tick(999)
+        self.assertEqual(self.rook.frozen_timer, 1)
+        self.assertTrue(self.rook.frozen)
+
+    def test_clear(self) -> None:
+        """
+        Test clear stops every effect without expiring it
+        """
+        self.effects.start(self.rook, FROZEN, 3)
+        self.effects.clear()
+        self.assertEqual(self.effects.tick(5), [])
+        self.assertEqual(len(self.effects), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,311 @@
+"""
+Unittest for GameEngine class found in engine.py
+
+"""
+
+import random
+import unittest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from effects import EFFECT_DURATION
+from engine import GameEngine, starting_pieces
+from chess_piece import ChessPiece, King, Pawn, Queen, Rook
+from tests.helpers import PieceCountTestCase
+
+
+class TestGameEngine(PieceCountTestCase):
+    """
+    TestGameEngine class to test GameEngine class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate GameEngine object
+        """
+        super().setUp()
+        self.engine = GameEngine(seed=1)
+
+    def test_starting_layout(self) -> None:
+        """
+        Test both armies start on their own rows
+        """
+        pieces = starting_pieces()
+        self.assertEqual(len(pieces), 32)
+        self.assertIsInstance(self.engine.piece_at(0, 4), King)
+        self.assertIsInstance(self.engine.piece_at(7, 3), Queen)
+        self.assertTrue(all(self.engine.board.is_empty(row, col)
+                            for row in range(2, 6) for col in range(8)))
+
+    def test_available_moves_from_start(self) -> None:
+        """
+        Test White has the usual 20 opening moves
+        """
+        moves = self.engine.available_moves()
+        self.assertEqual(len(moves), 20)
+        self.assertIn(((0, 1), (2, 2)), moves)
+
+    def test_step_valid_move(self) -> None:
+        """
+        Test a valid move is played and the turn passes
+        """
+        self.assertTrue(self.engine.step(((1, 4), (3, 4))))
+        self.assertIsInstance(self.engine.piece_at(3, 4), Pawn)
+        self.assertTrue(self.engine.board.is_empty(1, 4))
+        self.assertEqual(self.engine.current_turn, "Black")
+        self.assertEqual(self.engine.turn_count, 1)
+
+    def test_step_rejects_invalid_move(self) -> None:
+        """
+        Test invalid moves and moves out of turn change nothing
+        """
+        self.assertFalse(self.engine.step(((1, 4), (4, 4))))
+        self.assertFalse(self.engine.step(((6, 4), (5, 4))))
+        self.assertFalse(self.engine.step(((3, 3), (4, 3))))
+        self.assertEqual(self.engine.current_turn, "White")
+        self.assertEqual(len(self.engine.event_log), 0)
+
+    def test_capturing_king_ends_game(self) -> None:
+        """
+        Test capturing a King declares the winner
+        """
+        engine = GameEngine(seed=1, event_chance=0.0)
+        king = King("King", "Black", 3, 0, 1, 1, "any")
+        rook = Rook("Rook", "White", 3, 7, 2, 8, "line")
+        engine.pieces[:] = [king, rook]
+        engine.board.update(engine.pieces)
+
+        self.assertTrue(engine.step(((3, 7), (3, 0))))
+        self.assertTrue(engine.game_over)
+        self.assertEqual(engine.winner, "White")
+        self.assertEqual(engine.captured_black, [king])
+        self.assertIn("Checkmate! White wins.",
+                      engine.event_log.messages())
+        self.assertFalse(engine.step(((6, 0), (5, 0))))
+
+    def test_checkmate_ends_game(self) -> None:
+        """
+        Test a move that mates ends the game before the King is taken
+        """
+        engine = GameEngine(seed=1, event_chance=0.0)
+        pieces: list[ChessPiece] = [
+            King("King", "White", 0, 6, 1, 1, "any"),
+            King("King", "Black", 7, 7, 1, 1, "any"),
+            Rook("Rook", "Black", 7, 0, 2, 8, "line")]
+        pieces += [Pawn("Pawn", "White", 1, col, 8, 1, "forward")
+                   for col in (5, 6, 7)]
+        engine.pieces[:] = pieces
+        engine.board.update(engine.pieces)
+        engine.current_turn = "Black"
+
+        self.assertTrue(engine.step(((7, 0), (0, 0))))
+        self.assertTrue(engine.game_over)
+        self.assertEqual(engine.winner, "Black")
+        self.assertIn("Checkmate! Black wins.",
+                      engine.event_log.messages())
+        self.assertEqual(engine.available_moves(), [])
+
+    def test_stalemate_is_a_draw(self) -> None:
+        """
+        Test leaving the other side without a legal move draws
+        """
+        engine = GameEngine(seed=1, event_chance=0.0)
+        engine.pieces[:] = [King("King", "White", 0, 0, 1, 1, "any"),
+                            King("King", "Black", 7, 7, 1, 1, "any"),
+                            Queen("Queen", "Black", 2, 3, 1, 8, "any")]
+        engine.board.update(engine.pieces)
+        engine.current_turn = "Black"
+
+        self.assertTrue(engine.step(((2, 3), (2, 1))))
+        self.assertTrue(engine.game_over)
+        self.assertIsNone(engine.winner)
+        self.assertIn("Stalemate! The game is a draw.",
+                      engine.event_log.messages())
+
+    def test_moves_into_check_rejected(self) -> None:
+        """
+        Test a pinned piece cannot expose its own King
+        """
+        engine = GameEngine(seed=1, event_chance=0.0)
+        engine.pieces[:] = [King("King", "White", 0, 4, 1, 1, "any"),
+                            Rook("Rook", "White", 1, 4, 2, 8, "line"),
+                            King("King", "Black", 7, 7, 1, 1, "any"),
+                            Rook("Rook", "Black", 6, 4, 2, 8, "line")]
+        engine.board.update(engine.pieces)
+
+        self.assertFalse(engine.step(((1, 4), (1, 0))))
+        self.assertNotIn(((1, 4), (1, 0)), engine.available_moves())
+        self.assertTrue(engine.step(((1, 4), (6, 4))))
+
+    def test_make_and_unmake_move(self) -> None:
+        """
+        Test unmaking a capture restores the position, turn and captures
+        """
+        engine = GameEngine(seed=1, event_chance=0.0)
+        for move in (((1, 4), (3, 4)), ((6, 3), (4, 3))):
+            self.assertTrue(engine.make_move(move))
+        start = engine.board.zobrist_hash
+        order = list(engine.pieces)
+        black = engine.board.pieces_of("Black")
+
+        self.assertTrue(engine.make_move(((3, 4), (4, 3))))
+        self.assertEqual(len(engine.captured_black), 1)
+        self.assertEqual(len(engine.event_log), 0)
+        self.assertFalse(engine.make_move(((0, 0), (5, 0))))
+        self.assertEqual(len(engine.undo_stack), 3)
+
+        self.assertEqual(engine.unmake_move(), ((3, 4), (4, 3)))
+        self.assertEqual(engine.board.zobrist_hash, start)
+        self.assertEqual(list(engine.pieces), order)
+        self.assertEqual(engine.board.pieces_of("Black"), black)
+        self.assertEqual(engine.captured_black, [])
+        self.assertEqual(engine.current_turn, "White")
+        self.assertEqual(engine.turn_count, 2)
+
+    @settings(max_examples=10)
+    @given(st.integers(min_value=0, max_value=1000))
+    def test_unmake_restores_random_turns(self, seed: int) -> None:
+        """
+        Test unmaking moves played with random turns and events
+        replays the same game
+        """
+        engine = GameEngine(seed=seed)
+        chooser = random.Random(seed)
+        hashes = []
+        played = []
+        for _ in range(12):
+            moves = engine.available_moves()
+            if not moves:
+                break
+            move = chooser.choice(moves)
+            hashes.append(engine.board.zobrist_hash)
+            played.append(move)
+            engine.make_move(move, random_turn=True)
+        end = engine.board.zobrist_hash
+        frozen = list(engine.pieces.frozen_turns)
+
+        while engine.undo_stack:
+            engine.unmake_move()
+            self.assertEqual(engine.board.zobrist_hash, hashes.pop())
+        self.assertEqual(engine.board.zobrist_hash,
+                         engine.board.compute_hash())
+        for move in played:
+            engine.make_move(move, random_turn=True)
+        self.assertEqual(engine.board.zobrist_hash, end)
+        self.assertEqual(list(engine.pieces.frozen_turns), frozen)
+
+    @settings(max_examples=50)
+    @given(st.integers(min_value=0, max_value=1000))
+    def test_unmake_random_turns(self, seed: int) -> None:
+        """
+        Test random turns made between moves, as the space bar does,
+        are taken back with them and leave grid, store and hash whole
+        """
+        engine = GameEngine(seed=seed, event_chance=1.0)
+        engine.make_move(((1, 4), (3, 4)), random_turn=True)
+        start = engine.board.zobrist_hash
+        grid = [list(row) for row in engine.board.grid]
+        order = list(engine.pieces)
+        for _ in range(3):
+            engine.make_random_turn()
+        self.assertEqual(len(engine.undo_stack), 4)
+
+        for _ in range(3):
+            self.assertIsNone(engine.unmake_move())
+        self.assertEqual(engine.board.zobrist_hash, start)
+        self.assertEqual(engine.board.grid, grid)
+        self.assertEqual(list(engine.pieces), order)
+        self.assertEqual(engine.unmake_move(), ((1, 4), (3, 4)))
+        for piece in engine.pieces:
+            self.assertIs(engine.board.grid[piece._row][piece._col], piece)
+        on_board = sum(piece is not None
+                       for row in engine.board.grid for piece in row)
+        self.assertEqual(on_board, len(engine.pieces))
+        self.assertEqual(engine.board.zobrist_hash,
+                         engine.board.compute_hash())
+
+    def test_copy_is_independent(self) -> None:
+        """
+        Test moves on a copy leave the original engine alone
+        """
+        self.engine.step(((1, 4), (3, 4)))
+        clone = self.engine.copy()
+        self.assertEqual(clone.board.zobrist_hash,
+                         self.engine.board.zobrist_hash)
+        self.assertEqual(clone.current_turn, "Black")
+        self.assertEqual(clone.random_turn(), self.engine.random_turn())
+
+        self.assertTrue(clone.step(((6, 3), (4, 3))))
+        self.assertIsNotNone(self.engine.piece_at(6, 3))
+        self.assertEqual(self.engine.current_turn, "Black")
+
+    def test_position_round_trip(self) -> None:
+        """
+        Test an engine rebuilt from position() matches the original
+        """
+        self.engine.step(((1, 4), (3, 4)))
+        pawn = self.engine.piece_at(6, 0)
+        assert pawn is not None
+        self.engine.board.freeze_piece(pawn, 2)
+        position = self.engine.position()
+
+        rebuilt = GameEngine.from_position(position, event_chance=0.0)
+        self.assertEqual(rebuilt.board.zobrist_hash,
+                         self.engine.board.zobrist_hash)
+        self.assertEqual(rebuilt.current_turn, "Black")
+        self.assertEqual(list(rebuilt.pieces.frozen_turns),
+                         list(self.engine.pieces.frozen_turns))
+        self.assertEqual(rebuilt.available_moves(),
+                         self.engine.available_moves())
+        self.assertEqual(rebuilt.position(), position)
+
+    def test_random_turn_without_events(self) -> None:
+        """
+        Test a random turn without events only reports moves
+        """
+        engine = GameEngine(seed=3, event_chance=0.0)
+        messages = engine.random_turn()
+        self.assertEqual(len(messages), 1)
+        self.assertIn("valid moves", messages[0])
+        self.assertEqual(engine.event_log.messages(), messages)
+
+    @settings(max_examples=20)
+    @given(st.integers(min_value=0, max_value=1000))
+    def test_seeded_games_repeat(self, seed: int) -> None:
+        """
+        Test the same seed replays the same random turns
+        """
+        first = GameEngine(seed=seed)
+        second = GameEngine(seed=seed)
+        for _ in range(5):
+            self.assertEqual(first.random_turn(), second.random_turn())
+
+    def test_events_start_effects(self) -> None:
+        """
+        Test engine events run their overlays through the effects
+        """
+        pawn = self.engine.piece_at(1, 0)
+        assert pawn is not None
+        for event in self.engine.events:
+            event.apply(pawn, self.engine.pieces)
+        self.assertEqual(len(self.engine.effects), 2)
+        self.engine.effects.tick(EFFECT_DURATION)
+        queen = self.engine.piece_at(1, 0)
+        assert queen is not None
+        self.assertFalse(pawn.frozen or queen.promoted)
+        self.engine.reset()
+        self.assertEqual(len(self.engine.effects), 0)
+
+    def test_reset(self) -> None:
+        """
+        Test reset restores a fresh game
+        """
+        self.engine.step(((1, 4), (3, 4)))
+        self.engine.reset()
+        self.assertEqual(self.engine.current_turn, "White")
+        self.assertEqual(len(self.engine.pieces), 32)
+        self.assertEqual(len(self.engine.event_log), 0)
+        self.assertTrue(self.engine.board.is_empty(3, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
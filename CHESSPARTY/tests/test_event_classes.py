@@ -1,13 +1,14 @@
 import unittest
 from unittest.mock import MagicMock
 from hypothesis import given, strategies as st
-from typing import Optional, List
+from typing import MutableSequence, Optional
 from event_classes.base_random_event import RandomEvent
 from event_classes.explosion import Explosion
 from event_classes.freeze_piece import FreezePieceEvent
 from event_classes.promote_to_queen import PromoteToQueenEvent
 from board import Board
 from chess_piece import ChessPiece, Pawn, Queen
+from piece_store import PieceStore
 
 
 class DummyPiece(ChessPiece):
@@ -45,7 +46,8 @@ class TestRandomEvent(unittest.TestCase):
     def test_random_event_not_implemented(self) -> None:
         class IncompleteEvent(RandomEvent):
             def apply(self, piece: ChessPiece,
-                      pieces: Optional[List[ChessPiece]] = None) -> str:
+                      pieces: Optional[MutableSequence[ChessPiece]] = None
+                      ) -> str:
                 raise NotImplementedError()
 
         with self.assertRaises(NotImplementedError):
@@ -84,6 +86,37 @@ class TestExplosion(unittest.TestCase):
         result = self.explosion.trigger(0, 0, pieces)
         self.assertEqual(result, [piece2])
 
+    def test_explosion_updates_position_hash(self) -> None:
+        piece1 = DummyPiece(row=0, col=0)
+        piece2 = DummyPiece(row=4, col=4)
+        board = Board(pieces=[piece1, piece2])
+        Explosion(board).trigger(0, 0, [piece1, piece2])
+        self.assertEqual(board.zobrist_hash, Board([piece2]).zobrist_hash)
+
+    def test_explosion_shapes(self) -> None:
+        board = Board(pieces=[], rows=20, cols=20)
+        self.assertEqual(len(Explosion(board, 2).blast_area(10, 10)), 25)
+        self.assertEqual(
+            len(Explosion(board, 2, "diamond").blast_area(10, 10)), 13)
+        self.assertEqual(
+            len(Explosion(board, 2, "circle").blast_area(10, 10)), 13)
+        self.assertEqual(
+            len(Explosion(board, 2, "cross").blast_area(10, 10)), 9)
+        self.assertEqual(len(Explosion(board, 2).blast_area(0, 19)), 9)
+        with self.assertRaises(ValueError):
+            Explosion(board, shape="hexagon")
+
+    def test_explosion_mutates_store_in_place(self) -> None:
+        store = PieceStore()
+        near = Pawn("Pawn", "White", 30, 30, 8, 1, "forward", store)
+        far = Pawn("Pawn", "Black", 2, 2, 8, 1, "forward", store)
+        board = Board(store, rows=40, cols=40)
+        result = Explosion(board, 3, "diamond").trigger(28, 29, store)
+        self.assertIs(result, store)
+        self.assertEqual(list(store), [far])
+        self.assertIsNone(board.get_piece(30, 30))
+        self.assertEqual(near._row, 30)
+
 
 class TestFreezePieceEvent(unittest.TestCase):
     def test_freeze_applies_properly(self) -> None:
@@ -106,6 +139,16 @@ class TestFreezePieceEvent(unittest.TestCase):
         self.assertEqual(piece.frozen_timer, 100)
         self.assertIn(f"frozen for {turns} turn(s)", msg)
 
+    def test_freeze_updates_position_hash(self) -> None:
+        piece = Pawn("Pawn", "White", 1, 0, 8, 1, "forward")
+        board = Board(pieces=[piece])
+        start = board.zobrist_hash
+        FreezePieceEvent(turns=1, board=board).apply(piece)
+
+        self.assertTrue(piece.is_frozen())
+        self.assertNotEqual(board.zobrist_hash, start)
+        self.assertEqual(board.zobrist_hash, board.compute_hash())
+
 
 class TestPromoteToQueenEvent(unittest.TestCase):
     def setUp(self) -> None:
@@ -134,6 +177,30 @@ class TestPromoteToQueenEvent(unittest.TestCase):
 
         self.assertIsInstance(board.get_piece(6, 0), Pawn)
 
+    def test_promotion_respects_queens_on_board(self) -> None:
+        queens: list[ChessPiece] = [Queen("Queen", "White", 0, c, 1, 8, "any")
+                                    for c in range(4)]
+        pawn = Pawn("Pawn", "White", 6, 0, 8, 1, "forward")
+        pieces: list[ChessPiece] = queens + [pawn]
+        msg = PromoteToQueenEvent().apply(pawn, pieces)
+
+        self.assertIs(pieces[4], pawn)
+        self.assertIn("too many Queens", msg)
+
+        msg = PromoteToQueenEvent(queen_limit=5).apply(pawn, pieces)
+        self.assertIsInstance(pieces[4], Queen)
+
+    def test_promotion_updates_board(self) -> None:
+        pawn = Pawn("Pawn", "White", 6, 0, 8, 1, "forward")
+        board = Board(pieces=[pawn])
+
+        pieces: list[ChessPiece] = [pawn]
+        event = PromoteToQueenEvent(board)
+        event.apply(pawn, pieces)
+
+        self.assertIs(board.get_piece(6, 0), pieces[0])
+        self.assertIsInstance(board.get_piece(6, 0), Queen)
+
 
 if __name__ == "__main__":
     unittest.main()
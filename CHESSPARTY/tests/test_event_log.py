@@ -0,0 +1,62 @@
+"""
+Unittest for EventLog class found in event_log.py
+
+"""
+
+import io
+import unittest
+from event_log import EventLog, LogRecord, read_log
+
+
+class TestEventLog(unittest.TestCase):
+    """
+    TestEventLog class to test EventLog class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate EventLog object streaming to a StringIO sink
+        """
+        self.sink = io.StringIO()
+        self.log = EventLog(capacity=3, sink=self.sink)
+
+    def add(self, count: int) -> None:
+        """
+        Append count numbered records
+        """
+        for turn in range(count):
+            self.log.append(LogRecord(turn, "moves", f"m{turn}",
+                                      "White Pawn", ((1, turn), (2, turn))))
+
+    def test_ring_buffer_keeps_newest(self) -> None:
+        """
+        Test the oldest records are dropped once the log is full
+        """
+        self.add(5)
+        self.assertEqual(len(self.log), 3)
+        self.assertEqual(self.log.messages(), ["m2", "m3", "m4"])
+        self.assertEqual(self.log.messages(2), ["m3", "m4"])
+        self.assertEqual(self.log.messages(0), [])
+
+    def test_sink_receives_every_record(self) -> None:
+        """
+        Test dropped records are still streamed and can be replayed
+        """
+        self.add(5)
+        self.log.clear()
+        records = list(read_log(io.StringIO(self.sink.getvalue())))
+        self.assertEqual(len(self.log), 0)
+        self.assertEqual([r.turn for r in records], [0, 1, 2, 3, 4])
+        self.assertEqual(records[4], LogRecord(4, "moves", "m4", "White Pawn",
+                                               ((1, 4), (2, 4))))
+
+    def test_record_json_round_trip(self) -> None:
+        """
+        Test a record without piece or squares survives JSON
+        """
+        record = LogRecord(7, "all_frozen", "All pieces are frozen!")
+        self.assertEqual(LogRecord.from_json(record.to_json()), record)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
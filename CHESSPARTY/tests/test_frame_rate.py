@@ -0,0 +1,52 @@
+"""
+Unittest for AdaptiveFrameRate class found in frame_rate.py
+
+"""
+
+import unittest
+from frame_rate import AdaptiveFrameRate
+
+
+class TestAdaptiveFrameRate(unittest.TestCase):
+    """
+    TestAdaptiveFrameRate class to test AdaptiveFrameRate class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate AdaptiveFrameRate object
+        """
+        self.frame_rate = AdaptiveFrameRate(idle_fps=4, active_fps=60,
+                                            linger=100)
+
+    def test_drops_after_linger(self) -> None:
+        """
+        Test the rate stays up for linger ms, then drops to idle
+        """
+        self.assertEqual(self.frame_rate.update(False, 50), 60)
+        self.assertEqual(self.frame_rate.update(False, 49), 60)
+        self.assertEqual(self.frame_rate.update(False, 1), 4)
+        self.assertEqual(self.frame_rate.fps, 4)
+
+    def test_activity_ramps_up(self) -> None:
+        """
+        Test any activity brings back the active rate at once
+        """
+        self.frame_rate.update(False, 500)
+        self.assertEqual(self.frame_rate.update(True, 250), 60)
+        self.assertEqual(self.frame_rate.update(False, 50), 60)
+
+    def test_idle_waits(self) -> None:
+        """
+        Test idle wake-up timeout, and that a fixed rate never idles
+        """
+        self.frame_rate.update(False, 100)
+        self.assertTrue(self.frame_rate.idle)
+        self.assertEqual(self.frame_rate.timeout, 250)
+        fixed = AdaptiveFrameRate(idle_fps=30, active_fps=30, linger=0)
+        self.assertFalse(fixed.idle)
+        self.assertEqual(fixed.update(False, 500), 30)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,62 @@
+"""
+Unittest for MoveCache class found in move_cache.py
+
+"""
+
+import unittest
+from move_cache import MoveCache
+
+
+class TestMoveCache(unittest.TestCase):
+    """
+    TestMoveCache class to test MoveCache class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate MoveCache object
+        """
+        self.cache = MoveCache(capacity=2)
+
+    def test_get_returns_copy(self) -> None:
+        """
+        Test cached moves cannot be changed through a returned list
+        """
+        self.cache.put("a", [(1, 1)])
+        moves = self.cache.get("a")
+        assert moves is not None
+        moves.append((2, 2))
+        self.assertEqual(self.cache.get("a"), [(1, 1)])
+
+    def test_miss_and_hit_counters(self) -> None:
+        """
+        Test hit and miss counters
+        """
+        self.assertIsNone(self.cache.get("a"))
+        self.cache.put("a", [])
+        self.assertEqual(self.cache.get("a"), [])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_lru_eviction(self) -> None:
+        """
+        Test least recently used entry is evicted first
+        """
+        self.cache.put("a", [(0, 0)])
+        self.cache.put("b", [(1, 1)])
+        self.cache.get("a")
+        self.cache.put("c", [(2, 2)])
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNone(self.cache.get("b"))
+        self.assertEqual(self.cache.get("a"), [(0, 0)])
+
+    def test_clear(self) -> None:
+        """
+        Test clear empties the cache
+        """
+        self.cache.put("a", [(0, 0)])
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,48 @@
+"""
+Unittest for lookup tables found in move_tables.py
+
+"""
+
+import unittest
+from hypothesis import given
+from hypothesis.strategies import integers
+from move_tables import RAYS, KNIGHT_TARGETS, KING_TARGETS, build_ray
+
+
+class TestMoveTables(unittest.TestCase):
+    """
+    TestMoveTables class to test the precomputed tables
+    """
+
+    def test_ray_order(self) -> None:
+        """
+        Test rays are ordered outward from the square
+        """
+        self.assertEqual(RAYS[0][0][(1, 1)][:3], ((1, 1), (2, 2), (3, 3)))
+        self.assertEqual(len(RAYS[0][0][(1, 1)]), 7)
+        self.assertEqual(RAYS[0][0][(-1, 0)], ())
+
+    def test_corner_jumps(self) -> None:
+        """
+        Test corner squares only keep on-board targets
+        """
+        self.assertEqual(sorted(KNIGHT_TARGETS[0][0]), [(1, 2), (2, 1)])
+        self.assertEqual(sorted(KING_TARGETS[7][7]),
+                         [(6, 6), (6, 7), (7, 6)])
+
+    @given(integers(min_value=0, max_value=7),
+           integers(min_value=0, max_value=7))
+    def test_tables_stay_on_board(self, row: int, col: int) -> None:
+        """
+        Test every table entry is on the board using hypothesis data
+        """
+        squares = list(KNIGHT_TARGETS[row][col] + KING_TARGETS[row][col])
+        for direction, ray in RAYS[row][col].items():
+            self.assertEqual(ray, build_ray(row, col, *direction))
+            squares.extend(ray)
+        for r, c in squares:
+            self.assertTrue(0 <= r < 8 and 0 <= c < 8)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
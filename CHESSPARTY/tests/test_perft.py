@@ -0,0 +1,77 @@
+"""
+Unittest for the perft harness found in perft.py
+
+"""
+
+import contextlib
+import io
+import unittest
+from engine import GameEngine
+from perft import POSITIONS, divide, load_layout, main, perft
+from tests.helpers import PieceCountTestCase
+
+
+class TestPerft(PieceCountTestCase):
+    """
+    TestPerft class to test perft functions
+    """
+
+    def test_start_counts(self) -> None:
+        """
+        Test the starting layout from game.py gives the chess counts
+        """
+        engine = GameEngine(event_chance=0.0)
+        start = engine.board.zobrist_hash
+        self.assertEqual([perft(engine, depth) for depth in range(4)],
+                         [1, 20, 400, 8902])
+        self.assertEqual(engine.board.zobrist_hash, start)
+        self.assertEqual(engine.undo_stack, [])
+
+    def test_stored_positions(self) -> None:
+        """
+        Test every stored position to depth 2, and endgame to depth 3
+        """
+        for position in POSITIONS:
+            with self.subTest(position.name):
+                engine = load_layout(position.layout)
+                depths = 3 if position.name == "endgame" else 2
+                self.assertEqual(
+                    [perft(engine, depth) for depth in range(1, depths + 1)],
+                    list(position.nodes[:depths]))
+
+    def test_divide_adds_up(self) -> None:
+        """
+        Test divide splits the perft count over the first moves
+        """
+        engine = load_layout(POSITIONS[2].layout)
+        counts = divide(engine, 2)
+        self.assertEqual(len(counts), 14)
+        self.assertEqual(sum(counts.values()), 191)
+
+    def test_load_layout(self) -> None:
+        """
+        Test a layout matches the starting pieces, and bad ones fail
+        """
+        engine = load_layout(POSITIONS[0].layout)
+        self.assertEqual(engine.board.zobrist_hash,
+                         GameEngine(event_chance=0.0).board.zobrist_hash)
+        self.assertEqual(load_layout("4k3/8/8/8/8/8/8/4K3 b").current_turn,
+                         "Black")
+        for layout in ("8/8/8 w", "4k3/8/8/8/8/8/8/4K2 w",
+                       "4k3/8/8/8/8/8/8/4X3 w", "4k3/8/8/8/8/8/8/4K3"):
+            with self.assertRaises(ValueError):
+                load_layout(layout)
+
+    def test_main_reports(self) -> None:
+        """
+        Test the command line prints counts and rates
+        """
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            main(["--depth", "2", "--position", "start"])
+        self.assertIn("start        depth 2: 400 nodes", output.getvalue())
+        self.assertIn("nodes/sec", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
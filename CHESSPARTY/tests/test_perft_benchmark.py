@@ -0,0 +1,47 @@
+"""
+Benchmarks for move generation, run with pytest-benchmark
+
+Every benchmark also checks its node count, so a change shows up as a
+failure here whether it breaks the counts or only the speed. Save a
+baseline with make benchmark-save, and make benchmark fails once the
+median time of any benchmark regresses past the Makefile's
+BENCHMARK_FAIL against it.
+"""
+
+from typing import Any
+import pytest
+from perft import POSITIONS, PerftPosition, load_layout, perft
+
+pytest.importorskip("pytest_benchmark")
+
+PIECES = ["Pawn", "Knight", "Bishop", "Rook", "Queen", "King"]
+
+
+@pytest.mark.parametrize("position", POSITIONS,
+                         ids=[position.name for position in POSITIONS])
+def test_perft(benchmark: Any, position: PerftPosition) -> None:
+    """
+    Benchmark perft to depth 3 from each stored position; start is
+    the layout game.py begins with
+    """
+    engine = load_layout(position.layout)
+    nodes = benchmark(perft, engine, 3)
+    assert nodes == position.nodes[2]
+
+
+@pytest.mark.parametrize("name", PIECES)
+def test_get_valid_moves(benchmark: Any, name: str) -> None:
+    """
+    Benchmark get_valid_moves of every piece of one kind in the
+    middlegame position
+    """
+    engine = load_layout(POSITIONS[1].layout)
+    board = engine.board
+    pieces = [piece for piece in engine.pieces
+              if piece.get_name() == name]
+    assert pieces
+
+    def generate() -> int:
+        return sum(len(piece.get_valid_moves(board)) for piece in pieces)
+
+    assert benchmark(generate) > 0
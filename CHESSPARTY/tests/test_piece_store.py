@@ -0,0 +1,119 @@
+"""
+Unittest for PieceStore class found in piece_store.py
+
+"""
+
+import unittest
+from chess_piece import Pawn, Rook, Queen
+from piece_store import PieceRow, PieceStore
+from undo import UndoStep, undo_steps
+from tests.helpers import PieceCountTestCase
+
+
+class TestPieceStore(PieceCountTestCase):
+    """
+    TestPieceStore class to test PieceStore class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate a store holding a Pawn, a Rook and a Queen
+        """
+        super().setUp()
+        self.store = PieceStore()
+        self.pawn = Pawn("Pawn", "White", 1, 0, 8, 1, "forward", self.store)
+        self.rook = Rook("Rook", "Black", 7, 7, 2, 8, "line", self.store)
+        self.queen = Queen("Queen", "White", 0, 3, 1, 8, "any", self.store)
+
+    def test_pieces_are_views(self) -> None:
+        """
+        Test piece fields read and write the store arrays, and
+        move_to keeps the square in both the piece and the store
+        """
+        self.rook.move_to(4, 5)
+        self.rook.freeze(2)
+        self.assertEqual((self.store.rows[1], self.store.cols[1]), (4, 5))
+        self.assertEqual((self.rook._row, self.rook._col), (4, 5))
+        self.assertEqual(self.store.frozen_turns[1], 2)
+        self.store.frozen_turns[1] = 0
+        self.assertFalse(self.rook.is_frozen())
+
+    def test_remove_swaps_last_piece_in(self) -> None:
+        """
+        Test removal moves the last piece into the hole and the
+        removed piece keeps its state outside the store
+        """
+        handle = self.store.handle(self.queen)
+        self.pawn.frozen_timer = 40
+        self.store.remove(self.pawn)
+
+        self.assertEqual(list(self.store), [self.queen, self.rook])
+        self.assertEqual(self.store.index(self.queen), 0)
+        self.assertEqual((self.queen._row, self.queen._col), (0, 3))
+        self.assertIs(self.store.get(handle), self.queen)
+        self.assertNotIn(self.pawn, self.store)
+        self.assertEqual(self.pawn.frozen_timer, 40)
+        with self.assertRaises(ValueError):
+            self.store.remove(self.pawn)
+
+        # Each removed piece keeps its state in a row of its own
+        self.store.remove(self.rook)
+        self.assertIsInstance(self.rook._store, PieceRow)
+        self.assertIsNot(self.rook._store, self.pawn._store)
+        self.assertEqual((self.rook._row, self.rook._col), (7, 7))
+        self.store.append(self.pawn)
+        self.assertEqual(self.pawn.frozen_timer, 40)
+
+    def test_replace_in_place(self) -> None:
+        """
+        Test assigning to an index swaps one piece for another
+        """
+        new_queen = Queen("Queen", "White", 1, 0, 1, 8, "any")
+        self.store[0] = new_queen
+        self.assertIs(self.store[0], new_queen)
+        self.assertEqual(self.store.count_kind(Queen), 2)
+        self.assertEqual(self.store.count_kind(Pawn), 0)
+        self.assertEqual(self.pawn._row, 1)
+        with self.assertRaises(ValueError):
+            self.store[1] = new_queen
+
+    def test_list_operations(self) -> None:
+        """
+        Test slice assignment, insert and del behave like a list
+        """
+        self.store[:] = [self.rook, self.pawn]
+        self.assertEqual(list(self.store), [self.rook, self.pawn])
+        self.store.insert(0, self.queen)
+        self.assertEqual(list(self.store), [self.queen, self.rook, self.pawn])
+        self.assertEqual([p._index for p in self.store], [0, 1, 2])
+        del self.store[0]
+        self.assertEqual(len(self.store), 2)
+        self.assertEqual(self.queen._row, 0)
+
+    def test_copy_is_independent(self) -> None:
+        """
+        Test a cloned store does not share state with the original
+        """
+        clone = self.store.copy()
+        clone[1].move_to(2, 7)
+        self.assertEqual(self.rook._row, 7)
+        self.assertIsInstance(clone[1], Rook)
+        self.assertEqual(clone[1].get_color(), "Black")
+        self.assertEqual(Rook.get_unit_count(), self._unit_counts[Rook] + 1)
+
+    def test_journal_undoes_changes(self) -> None:
+        """
+        Test journaled removals and replacements can be taken back
+        """
+        journal: list[UndoStep] = []
+        self.store.journal = journal
+        self.store.remove(self.pawn)
+        self.store[0] = Queen("Queen", "White", 2, 2, 1, 8, "any")
+        self.store.journal = None
+        undo_steps(journal)
+        self.assertEqual(list(self.store), [self.pawn, self.rook, self.queen])
+        self.assertEqual(self.store.rows[2], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
@@ -0,0 +1,86 @@
+"""
+Unittest for the self-play runner found in selfplay.py
+
+"""
+
+import unittest
+import selfplay
+from engine import GameEngine
+from selfplay import SelfPlayStats, init_worker, play_batch, play_game
+from tests.helpers import PieceCountTestCase
+
+
+class TestSelfPlay(PieceCountTestCase):
+    """
+    TestSelfPlay class to test self-play functions
+    """
+
+    def test_play_game_finishes(self) -> None:
+        """
+        Test a game ends by King capture, stalemate or ply limit
+        """
+        engine = GameEngine()
+        play_game(engine, seed=5, max_plies=40)
+        self.assertTrue(engine.game_over or engine.turn_count <= 40)
+        self.assertGreater(engine.turn_count, 0)
+
+    def test_batches_are_reproducible(self) -> None:
+        """
+        Test the same seeds give the same totals on a reused engine
+        """
+        init_worker(0.5, 4)
+        first = play_batch(range(3), 60)
+        second = play_batch(range(3), 60)
+        self.assertEqual(first.games, 3)
+        self.assertEqual(first.results, second.results)
+        self.assertEqual(first.total_plies, second.total_plies)
+        self.assertEqual(first.event_counts, second.event_counts)
+
+    def test_play_batch_requires_worker_engine(self) -> None:
+        """
+        Test play_batch refuses to run before init_worker
+        """
+        engine = selfplay._engine
+        selfplay._engine = None
+        try:
+            with self.assertRaises(RuntimeError):
+                play_batch(range(1), 10)
+        finally:
+            selfplay._engine = engine
+
+    def test_merge_and_report(self) -> None:
+        """
+        Test merging totals and the printed report
+        """
+        engine = GameEngine(seed=2)
+        engine.game_over = True
+        engine.winner = "White"
+        engine.turn_count = 10
+        engine.event_counts = {"FreezePieceEvent": 2}
+
+        first = SelfPlayStats()
+        first.add_game(engine)
+        second = SelfPlayStats()
+        second.add_game(engine)
+        first.merge(second)
+
+        self.assertEqual(first.games, 2)
+        self.assertEqual(first.results["White"], 2)
+        self.assertEqual(first.total_plies, 20)
+        self.assertEqual(first.event_counts["FreezePieceEvent"], 4)
+        report = first.report(elapsed=0.5)
+        self.assertIn("White:        100.0%", report)
+        self.assertIn("4 games/sec", report)
+
+    def test_run_across_processes(self) -> None:
+        """
+        Test games are spread over a process pool and merged
+        """
+        stats = selfplay.run(games=6, workers=2, batch_size=2,
+                             max_plies=20)
+        self.assertEqual(stats.games, 6)
+        self.assertEqual(sum(stats.results.values()), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
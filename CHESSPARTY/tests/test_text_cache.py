@@ -0,0 +1,80 @@
+"""
+Unittest for TextCache class found in text_cache.py
+
+"""
+
+import unittest
+from text_cache import Color, TextCache
+
+
+class MockFont:
+    """
+    Font stand-in that records every render call
+    """
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def render(self, text: str, antialias: bool,
+               color: Color) -> tuple[str, Color]:
+        self.calls.append(text)
+        return (text, color)
+
+
+class TestTextCache(unittest.TestCase):
+    """
+    TestTextCache class to test TextCache class functions
+    """
+
+    def setUp(self) -> None:
+        """
+        Generate TextCache and MockFont objects
+        """
+        self.cache: TextCache[tuple[str, Color]] = TextCache(capacity=2)
+        self.font = MockFont()
+
+    def test_render_once(self) -> None:
+        """
+        Test repeated text is rendered by the font only once
+        """
+        first = self.cache.render(self.font, "a", (0, 0, 0))
+        second = self.cache.render(self.font, "a", (0, 0, 0))
+        self.assertIs(first, second)
+        self.assertEqual(self.font.calls, ["a"])
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_key_includes_font_and_color(self) -> None:
+        """
+        Test the same text in another color or font is a new entry
+        """
+        other = MockFont()
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.assertEqual(self.cache.render(self.font, "a", (9, 9, 9)),
+                         ("a", (9, 9, 9)))
+        self.cache.render(other, "a", (0, 0, 0))
+        self.assertEqual(other.calls, ["a"])
+
+    def test_lru_eviction(self) -> None:
+        """
+        Test least recently used text is evicted first
+        """
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.cache.render(self.font, "b", (0, 0, 0))
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.cache.render(self.font, "c", (0, 0, 0))
+        self.assertEqual(len(self.cache), 2)
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.cache.render(self.font, "b", (0, 0, 0))
+        self.assertEqual(self.font.calls, ["a", "b", "c", "b"])
+
+    def test_clear(self) -> None:
+        """
+        Test clear empties the cache
+        """
+        self.cache.render(self.font, "a", (0, 0, 0))
+        self.cache.clear()
+        self.assertEqual(len(self.cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()  # pragma: no cover
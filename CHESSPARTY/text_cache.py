@@ -0,0 +1,60 @@
+from collections import OrderedDict
+from typing import Generic, Protocol, TypeVar
+
+Color = tuple[int, int, int]
+S = TypeVar("S")
+S_co = TypeVar("S_co", covariant=True)
+
+
+class TextFont(Protocol[S_co]):
+    """
+    Anything that renders text like pygame.font.Font
+    """
+
+    def render(self, text: str, antialias: bool, color: Color) -> S_co:
+        ...  # pragma: no cover
+
+
+class TextCache(Generic[S]):
+    """
+    Bounded least-recently-used cache of rendered text surfaces,
+    keyed by (font, text, color)
+    """
+
+    def __init__(self, capacity: int = 128) -> None:
+        """
+        Initialize an empty cache holding at most capacity surfaces
+        """
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[
+            tuple[TextFont[S], str, Color], S] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def render(self, font: TextFont[S], text: str, color: Color) -> S:
+        """
+        Antialiased text in color, rendered by font only the first
+        time it is asked for. Callers must not draw onto the result
+        """
+        key = (font, text, color)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, True, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return surface
+
+    def clear(self) -> None:
+        """
+        Drop every surface
+        """
+        self._entries.clear()
@@ -0,0 +1,37 @@
+"""
+Undo records for GameEngine.make_move, make_random_turn and unmake_move.
+
+While a move is made, the Board and the PieceStore append one undo step
+to a shared journal for each change they make: the method that reverses
+it and its arguments. Replaying the steps backwards restores the
+position exactly, without copying the board or the pieces.
+"""
+
+from typing import Any, Callable, NamedTuple, Optional
+
+# (method reversing one change, its arguments)
+UndoStep = tuple[Callable[..., object], tuple[Any, ...]]
+
+
+class UndoRecord(NamedTuple):
+    """
+    Everything make_move changed, enough to take it back
+    """
+    move: Optional[tuple[tuple[int, int], tuple[int, int]]]  # None: random
+    turn: str
+    turn_count: int
+    winner: Optional[str]
+    game_over: bool
+    captured_white: int  # Lengths of the capture lists before the move
+    captured_black: int
+    rng_state: Optional[tuple[Any, ...]]  # Only kept with a random turn
+    event_counts: Optional[dict[str, int]]
+    steps: list[UndoStep]
+
+
+def undo_steps(steps: list[UndoStep]) -> None:
+    """
+    Reverse every change in steps, last change first
+    """
+    for undo, args in reversed(steps):
+        undo(*args)
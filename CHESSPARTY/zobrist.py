@@ -0,0 +1,39 @@
+"""
+Zobrist keys for hashing Board positions.
+
+Every (piece class, color, square) gets a fixed random 64-bit key, and
+so does every (square, frozen turns) pair. A position hash is the XOR of
+the keys of the pieces on the board and their freeze counters, so it can
+be updated in O(1) as pieces are placed, removed, frozen and thawed. Keys are
+derived from a string seed, which keeps hashes identical across runs
+and worker processes.
+"""
+
+import random
+
+_piece_keys: dict[tuple[str, str, int, int], int] = {}
+_frozen_keys: dict[tuple[int, int, int], int] = {}
+
+
+def piece_key(kind: str, color: str, row: int, col: int) -> int:
+    """
+    Key for a piece of class kind and color standing on (row, col)
+    """
+    index = (kind, color, row, col)
+    key = _piece_keys.get(index)
+    if key is None:
+        key = random.Random(f"{kind}:{color}:{row}:{col}").getrandbits(64)
+        _piece_keys[index] = key
+    return key
+
+
+def frozen_key(row: int, col: int, turns: int) -> int:
+    """
+    Key for a piece on (row, col) that is frozen for turns more turns
+    """
+    index = (row, col, turns)
+    key = _frozen_keys.get(index)
+    if key is None:
+        key = random.Random(f"frozen:{row}:{col}:{turns}").getrandbits(64)
+        _frozen_keys[index] = key
+    return key